@@ -9,9 +9,18 @@ import xml.etree.ElementTree as ET
 import csv
 import io
 import base64
+import html
 import math
+import contextlib
+import queue
+import threading
+import sqlite3
+import struct
+import re
 import argparse
-from functools import partial
+from functools import partial, lru_cache
+from itertools import islice
+from concurrent.futures import ThreadPoolExecutor
 import importlib.util # For dynamic module loading
 import importlib # For module reloading
 import shutil # For copying plugin files
@@ -19,10 +28,41 @@ import traceback # For detailed error logging
 
 try:
     from PIL import Image, ExifTags
+    from PIL.TiffImagePlugin import IFDRational
     PIL_AVAILABLE = True
 except ImportError:
     PIL_AVAILABLE = False
 
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+try:
+    from numba import njit # Needs NumPy itself, so it is only ever used alongside it
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    from blake3 import blake3
+    BLAKE3_AVAILABLE = True
+except ImportError:
+    BLAKE3_AVAILABLE = False
+
+try:
+    import pybase64 # SIMD Base64 codec with the same API as the base64 module
+    PYBASE64_AVAILABLE = True
+except ImportError:
+    PYBASE64_AVAILABLE = False
+
 try:
     import matplotlib
     matplotlib.use('QtAgg')
@@ -34,23 +74,24 @@ except ImportError:
 
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-    QPushButton, QFileDialog, QLabel, QTabWidget, QTextEdit, QStatusBar,
+    QPushButton, QFileDialog, QLabel, QTabWidget, QTextEdit, QPlainTextEdit, QStatusBar,
     QMessageBox, QProgressBar, QSizePolicy, QScrollArea, QComboBox,
     QSplitter, QFileSystemModel, QTreeView, QLineEdit, QDialog,
     QMenuBar, QToolBar, QMenu, QGraphicsView, QGraphicsScene,
     QGraphicsPixmapItem, QHeaderView, QTableWidget, QTableWidgetItem,
     QSpinBox, QCheckBox, QTextBrowser, QListWidget, QListWidgetItem,
-    QStackedWidget, QFormLayout, QDoubleSpinBox, QStyle,QProxyStyle, QStyleOption # Added QFormLayout, QDoubleSpinBox
+    QStackedWidget, QFormLayout, QDoubleSpinBox, QStyle,QProxyStyle, QStyleOption, # Added QFormLayout, QDoubleSpinBox
+    QTableView
 )
 from PySide6.QtCore import (
     Qt, QThread, Signal, QRunnable, QThreadPool, QUrl, QTimer,
     QFileSystemWatcher, QCoreApplication, QTranslator, QLocale, QSize,
-    QPoint, QRect, QDir, Slot, QObject
+    QPoint, QRect, QDir, Slot, QObject, QSignalBlocker, QAbstractTableModel, QModelIndex, QEvent
 )
 from PySide6.QtGui import (
-    QIcon, QTextCharFormat, QTextCursor, QSyntaxHighlighter,
+    QIcon, QTextCharFormat, QTextCursor,
     QTextDocument, QFont, QColor, QPalette, QDesktopServices,
-    QImage, QPixmap, QPainter, QBrush, QKeySequence, QAction, QFontDatabase,
+    QImage, QImageReader, QImageIOHandler, QPixmap, QPainter, QBrush, QKeySequence, QAction, QFontDatabase,
     QTextLayout, QTextLine
 )
 
@@ -68,6 +109,8 @@ SUPPORTED_ENCODINGS = ['UTF-8', 'UTF-16', 'UTF-16BE', 'UTF-16LE', 'UTF-32', 'UTF
 THEME_SETTINGS_FILE = os.path.join(os.path.expanduser('~'), '.infoscava_theme.json')
 # Path for application settings file
 APP_SETTINGS_FILE = os.path.join(os.path.expanduser('~'), '.infoscava_settings.json')
+# Path for the cache of file hashes and entropy, keyed by path, size and modification time
+ANALYSIS_CACHE_FILE = os.path.join(os.path.expanduser('~'), '.infoscava_cache.db')
 # Directory for plugin definition files (.infoscava)
 PLUGIN_DIRECTORY = os.path.join(os.path.dirname(os.path.abspath(__file__)), "plugins")
 # File to store persistent list of loaded plugins
@@ -75,15 +118,100 @@ PLUGIN_CONFIG_FILE = os.path.join(PLUGIN_DIRECTORY, "plugins_config.json")
 # File to store plugin history
 PLUGIN_HISTORY_FILE = os.path.join(PLUGIN_DIRECTORY, "plugin_history.json")
 
+# Directory and file name template of the compiled translation catalogs (Qt resource paths)
+_QM_DIR = ":/translations"
+_QM_PATH_TMPL = _QM_DIR + "/infoscava_{}.qm"
+
 # Default settings values
 DEFAULT_APP_SETTINGS = {
     'MAX_FILE_SIZE_FOR_FULL_READ': 20 * 1024 * 1024, # 20 MB
     'MAX_TEXT_PREVIEW_LINES': 10000,
     'MAX_HEX_PREVIEW_BYTES': 16384,
     'MAX_STRUCTURED_PREVIEW_LINES': 100,
-    'MAX_PLUGIN_HISTORY_ENTRIES': 200
+    'MAX_PLUGIN_HISTORY_ENTRIES': 200,
+    'COMPUTE_MD5': True, # MD5 is an extra full hash next to SHA-256; users who never read it can turn it off
+    'MAX_FILE_SIZE_FOR_MD5': 100 * 1024 * 1024 # 100 MB; bigger files skip MD5 even when it is enabled
 }
 
+# Rough average line length used to turn line-based preview limits into a byte budget for large files
+ESTIMATED_BYTES_PER_LINE = 256
+
+# Most bytes of a file the Base64 tab encodes and shows (about 16 MB of text); beyond that Qt's layout stalls
+MAX_BASE64_PREVIEW_BYTES = 12 * 1024 * 1024
+IMAGE_PREVIEW_MAX_SIZE = 1024 # Longest edge of the preview decoded on the analysis thread
+# Characters per line of the Base64 tab (the MIME line length); one unbroken line would take Qt seconds to lay out
+BASE64_LINE_CHARS = 76
+# Bytes encoded per chunk streamed into the Base64 tab; whole lines (57 bytes each, a multiple of 3) so chunks
+# concatenate without padding or short lines
+BASE64_CHUNK_BYTES = (BASE64_LINE_CHARS // 4 * 3) * 16 * 1024
+
+# Byte -> character table for the ASCII column of the hex view: printable ASCII as-is, everything else as '.'
+_HEX_ASCII_TABLE = bytes(c if 32 <= c <= 126 else 0x2E for c in range(256))
+
+# EXIF tags shown in the Image Metadata tab; everything else (MakerNote, thumbnails, ...) is never decoded
+_DISPLAYED_EXIF_TAGS = frozenset({
+    'Make', 'Model', 'Software', 'Artist', 'Copyright', 'ImageDescription',
+    'DateTime', 'DateTimeOriginal', 'DateTimeDigitized', 'Orientation',
+    'XResolution', 'YResolution', 'ResolutionUnit', 'ExifImageWidth', 'ExifImageHeight',
+    'ExposureTime', 'FNumber', 'ISOSpeedRatings', 'FocalLength', 'Flash', 'LensModel',
+})
+
+# Row template for the metadata table of the HTML export
+_HTML_ROW_TMPL = '<tr><td class="label">{}:</td><td>{}</td></tr>'
+# Fixed scaffolding of the HTML export; the variable-length parts are written between these pieces
+_HTML_REPORT_HEAD_TMPL = """
+    <!DOCTYPE html>
+    <html lang="en">
+    <head>
+        <meta charset="UTF-8">
+        <meta name="viewport" content="width=device-width, initial-scale=1.0">
+        <title>{title}</title>
+        <style>{style}</style>
+    </head>
+    <body>
+        <h1>{title}</h1>
+        <div class="section">
+            <h2>{metadata_heading}</h2>
+            <table>
+                <tbody>
+    """
+_HTML_METADATA_TAIL = """
+                </tbody>
+            </table>
+        </div>
+    """
+_HTML_REPORT_TAIL = """
+    </body>
+    </html>
+    """
+# Preview section of the HTML export
+_HTML_SECTION_TMPL = """
+        <div class="section">
+            <h2>{}</h2>
+            <pre>{}</pre>
+        </div>
+        """
+# Stylesheet of the HTML export
+_HTML_REPORT_STYLE = """
+            body { font-family: Arial, sans-serif; margin: 20px; background-color: #f4f4f4; color: #333; }
+            h1 { color: #0056b3; }
+            h2 { color: #007bff; border-bottom: 1px solid #ccc; padding-bottom: 5px; margin-top: 20px; }
+            .section { background-color: #fff; border-radius: 8px; padding: 15px; margin-bottom: 15px; box-shadow: 0 2px 4px rgba(0,0,0,0.1); }
+            .label { font-weight: bold; margin-right: 5px; color: #555; }
+            pre { background-color: #eee; padding: 10px; border-radius: 5px; overflow-x: auto; white-space: pre-wrap; word-break: break-all; }
+            table { width: 100%; border-collapse: collapse; margin-top: 10px; }
+            th, td { border: 1px solid #ddd; padding: 8px; text-align: left; }
+            th { background-color: #f2f2f2; }
+        """
+
+# Colours used while painting and highlighting, built once with the integer constructor
+_CLR_LINE_NUMBER_BG = QColor(240, 240, 240)
+_CLR_LINE_NUMBER = QColor(120, 120, 120)
+_CLR_CURRENT_LINE_NUMBER = QColor(0, 0, 255)
+_CLR_CURRENT_MATCH_BG = QColor(255, 165, 0)
+_CLR_OTHER_MATCH_BG = QColor(255, 255, 0)
+_CLR_MATCH_TEXT = QColor(0, 0, 0)
+
 
 # --- Utility Functions ---
 
@@ -97,67 +225,361 @@ def human_readable_size(size_bytes):
     s = round(size_bytes / p, 2)
     return f"{s} {units[i]}"
 
-def calculate_hash(filepath, hash_algo):
-    """Calculates the hash of a file using the specified algorithm."""
-    hasher = hash_algo()
+def _head_text(text_edit, max_chars):
+    """Returns the first max_chars characters of a text edit's plain text without copying the whole document."""
+    document = text_edit.document()
+    cursor = QTextCursor(document)
+    cursor.setPosition(min(max_chars, document.characterCount() - 1), QTextCursor.KeepAnchor)
+    return cursor.selection().toPlainText() # Same paragraph and non-breaking-space handling as toPlainText()
+
+def _atomic_write_json(path, data, **dump_kwargs):
+    """Writes data as JSON to path via a synced temp file and an atomic rename, so a crash never leaves a torn file."""
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, **dump_kwargs)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+def _read_preview_bytes(f, cap):
+    """Reads at most cap bytes from the open binary file f (everything if cap is None)."""
+    return f.read() if cap is None else f.read(cap)
+
+def _new_hasher(hash_algo):
+    """
+    Creates a hash object for fingerprinting, not security: usedforsecurity=False keeps OpenSSL's
+    accelerated implementations available on FIPS-restricted builds. Constructors without the flag are called plainly.
+    """
     try:
-        with open(filepath, 'rb') as f:
-            while chunk := f.read(8192): # Read in chunks to handle large files efficiently
-                hasher.update(chunk)
-        return hasher.hexdigest()
-    except Exception as e:
-        return f"Error: {e}"
+        return hash_algo(usedforsecurity=False)
+    except TypeError:
+        return hash_algo()
 
 def detect_encoding(filepath):
     """Detects the character encoding of a file using chardet."""
     try:
+        detector = chardet.UniversalDetector()
         with open(filepath, 'rb') as f:
-            raw_data = f.read(1024 * 1024) # Read up to 1MB for detection
-        result = chardet.detect(raw_data)
+            # Feed 16KB blocks (still at most 1MB) and stop once the detector is confident
+            for _ in range(64):
+                block = f.read(16 * 1024)
+                if not block:
+                    break
+                detector.feed(block)
+                if detector.done:
+                    break
+        result = detector.close()
         return result['encoding'], result['confidence']
     except Exception as e:
         return None, 0.0
 
-def calculate_shannon_entropy(filepath):
-    """Calculates the Shannon entropy of a file."""
-    try:
-        with open(filepath, 'rb') as f:
-            byte_data = f.read()
-        if not byte_data:
+if NUMBA_AVAILABLE:
+    @njit(cache=True, nogil=True)
+    def _count_bytes_jit(data, hist):
+        """Adds the byte frequencies of a uint8 array to hist; compiled, and runs without the GIL."""
+        for byte in data:
+            hist[byte] += 1
+
+def _new_byte_histogram():
+    """Returns an empty 256-bin byte frequency table."""
+    return np.zeros(256, dtype=np.uint64) if NUMPY_AVAILABLE else [0] * 256
+
+def _update_byte_histogram(hist, chunk):
+    """Adds the byte frequencies of chunk to hist in place."""
+    if NUMBA_AVAILABLE:
+        _count_bytes_jit(np.frombuffer(chunk, dtype=np.uint8), hist) # No intermediate intp array like bincount
+    elif NUMPY_AVAILABLE:
+        hist += np.bincount(np.frombuffer(chunk, dtype=np.uint8), minlength=256).astype(np.uint64)
+    else:
+        for byte in chunk:
+            hist[byte] += 1
+
+def _entropy_from_histogram(hist):
+    """Returns the Shannon entropy (bits per byte) described by a byte frequency table."""
+    if NUMPY_AVAILABLE:
+        total_bytes = int(hist.sum())
+        if not total_bytes:
             return 0.0
+        p = hist[hist > 0].astype(np.float64) / total_bytes
+        return float(-(p * np.log2(p)).sum())
+
+    total_bytes = sum(hist)
+    if not total_bytes:
+        return 0.0
+    entropy = 0.0
+    for count in hist:
+        if count > 0:
+            probability = count / total_bytes
+            entropy -= probability * math.log2(probability)
+    return entropy
+
+def _parse_json(text):
+    """
+    Parses JSON text, with orjson when available. Raises json.JSONDecodeError on invalid input.
+    Returns the data and whether orjson parsed it (and so can also pretty-print it losslessly).
+    """
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.loads(text), True
+        except orjson.JSONDecodeError:
+            pass # orjson rejects some input the stdlib takes (NaN, Infinity); let json decide and word the error
+    return json.loads(text), False
+
+def _pretty_json(data, with_orjson=False):
+    """Pretty-prints parsed JSON for display."""
+    if with_orjson:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode('utf-8')
+    return json.dumps(data, indent=2, ensure_ascii=False) # Same layout as OPT_INDENT_2
 
-        frequency = [0] * 256
-        for byte in byte_data:
-            frequency[byte] += 1
-
-        entropy = 0.0
-        total_bytes = len(byte_data)
-        for count in frequency:
-            if count > 0:
-                probability = count / total_bytes
-                entropy -= probability * math.log2(probability)
-        return entropy
+# Line boundaries of str.splitlines that csv.reader keeps inside a field
+_CSV_UNSAFE_LINE_BREAKS = '\v\f\x1c\x1d\x1e\x85\u2028\u2029'
+
+def _split_simple_csv(text, dialect):
+    """
+    Splits CSV text into rows with str.splitlines and str.split, giving the same rows as csv.reader.
+    Returns None when the text uses quoting, escapes or line breaks that need the full reader.
+    """
+    if (dialect.quotechar and dialect.quotechar in text) or (dialect.escapechar and dialect.escapechar in text):
+        return None
+    if dialect.skipinitialspace or any(c in text for c in _CSV_UNSAFE_LINE_BREAKS):
+        return None
+    if text.count('\r') != text.count('\r\n'): # csv.reader rejects a lone '\r' in an unquoted field
+        return None
+    delimiter = dialect.delimiter
+    return [line.split(delimiter) if line else [] for line in text.splitlines()] # csv.reader yields [] for blank lines
+
+def _first_lines(text, max_lines):
+    """Returns the first max_lines '\n'-separated lines of text without splitting the rest of it."""
+    if max_lines <= 0:
+        return ""
+    end = -1
+    for _ in range(max_lines):
+        end = text.find('\n', end + 1)
+        if end == -1:
+            return text
+    return text[:end]
+
+def _xml_preview_lines(text, max_lines):
+    """
+    Pretty-prints the first max_lines lines of an XML document while parsing it incrementally, so only the part
+    that is shown gets parsed. The text may be cut off (large-file previews are); parsing just stops there.
+    Raises ET.ParseError for malformed XML within the part that is read.
+    """
+    parser = ET.XMLPullParser(events=('start-ns', 'start', 'end'))
+    prefixes = {} # Namespace URI -> prefix, so tags print as written rather than as {uri}name
+    lines = []
+    pending = None # (element, depth) whose start tag waits until we know whether it has children
+    closed = None # (element, depth) just printed, whose tail text is only known at the next event
+
+    def qualified(name):
+        if name[0] == '{':
+            uri, local = name[1:].split('}', 1)
+            prefix = prefixes.get(uri)
+            return f"{prefix}:{local}" if prefix else local
+        return name
+
+    def open_tag(elem):
+        attrs = "".join(f' {qualified(k)}="{html.escape(v)}"' for k, v in elem.attrib.items())
+        return f"<{qualified(elem.tag)}{attrs}"
+
+    def flush_pending():
+        elem, depth = pending
+        text = (elem.text or "").strip()
+        lines.append("  " * depth + open_tag(elem) + ">" + html.escape(text, quote=False))
+
+    def flush_closed():
+        elem, depth = closed
+        tail = (elem.tail or "").strip() # Mixed content: text after the element, inside its parent
+        if tail:
+            lines.append("  " * depth + html.escape(tail, quote=False))
+        elem.clear() # Drop what has been printed
+
+    depth = 0
+    for start in range(0, len(text), 64 * 1024):
+        parser.feed(text[start:start + 64 * 1024])
+        for event, item in parser.read_events():
+            if closed and event != 'start-ns':
+                flush_closed()
+                closed = None
+            if event == 'start-ns':
+                prefixes.setdefault(item[1], item[0])
+            elif event == 'start':
+                if pending:
+                    flush_pending()
+                pending = (item, depth)
+                depth += 1
+            else:
+                depth -= 1
+                if pending and pending[0] is item: # A leaf: print it on one line
+                    text_value = (item.text or "").strip()
+                    tag = open_tag(item)
+                    line = f"{tag}>{html.escape(text_value, quote=False)}</{qualified(item.tag)}>" if text_value else f"{tag} />"
+                    lines.append("  " * depth + line)
+                    pending = None
+                else:
+                    lines.append("  " * depth + f"</{qualified(item.tag)}>")
+                closed = (item, depth)
+            if len(lines) >= max_lines:
+                return lines[:max_lines]
+    if pending:
+        flush_pending()
+    return lines[:max_lines]
+
+def _read_scaled_image(filepath, bounds):
+    """
+    Decodes an image file straight to a size that fits bounds (a QSize), upright per its EXIF orientation.
+    JPEG is decoded at a reduced DCT scale instead of being scaled after a full decode. Safe off the GUI thread.
+    """
+    reader = QImageReader(filepath)
+    reader.setAutoTransform(True)
+    size = reader.size()
+    if size.isValid():
+        if reader.transformation() & QImageIOHandler.TransformationRotate90:
+            bounds = bounds.transposed() # The decoder scales before it rotates
+        if size.width() > bounds.width() or size.height() > bounds.height():
+            reader.setScaledSize(size.scaled(bounds, Qt.KeepAspectRatio))
+    return reader.read()
+
+def _image_preview(img):
+    """Downscale an open Pillow image to a preview-sized QImage, for formats Qt cannot read (safe off the GUI thread)."""
+    img.draft('RGB', (IMAGE_PREVIEW_MAX_SIZE, IMAGE_PREVIEW_MAX_SIZE)) # JPEG decodes at a reduced DCT scale
+    img.thumbnail((IMAGE_PREVIEW_MAX_SIZE, IMAGE_PREVIEW_MAX_SIZE), Image.LANCZOS)
+    img = img.convert('RGBA')
+    data = img.tobytes('raw', 'RGBA')
+    return QImage(data, img.width, img.height, img.width * 4, QImage.Format_RGBA8888).copy() # Detach from `data`
+
+def _dms_to_degrees(dms):
+    """Converts an EXIF (degrees, minutes, seconds) tuple to decimal degrees; missing parts count as 0."""
+    d, m, sec = (tuple(float(v) for v in dms[:3]) + (0.0, 0.0, 0.0))[:3]
+    return d + m / 60 + sec / 3600
+
+def calculate_hashes_and_entropy(filepath, hash_algos, progress_callback=None):
+    """
+    Calculates several hashes and the Shannon entropy of a file from a single read.
+    Each hasher and the byte histogram is fed on its own thread, so hashlib (which releases the GIL
+    on large buffers) and NumPy work on separate cores while the next chunk is read.
+    Returns the hex digests in the order given, the entropy and the byte histogram it was computed from
+    (None on error), so callers can plot the histogram without counting the bytes again.
+    """
+    hashers = [_new_hasher(hash_algo) for hash_algo in hash_algos]
+    hist = _new_byte_histogram()
+    updates = [hasher.update for hasher in hashers] + [partial(_update_byte_histogram, hist)]
+    queues = [queue.Queue(maxsize=8) for _ in updates] # Bounded so a slow consumer throttles the reader
+    errors = []
+
+    def consume(q, update):
+        failed = False
+        while (chunk := q.get()) is not None: # Keep draining after a failure so the reader never blocks
+            if not failed:
+                try:
+                    update(chunk)
+                except Exception as e:
+                    errors.append(e)
+                    failed = True
+
+    threads = [threading.Thread(target=consume, args=(q, update), daemon=True) for q, update in zip(queues, updates)]
+    for thread in threads:
+        thread.start()
+
+    try:
+        total = os.path.getsize(filepath) if progress_callback else 0
+        done = 0
+        with open(filepath, 'rb') as f:
+            # A fresh bytes object per chunk rather than a reused buffer, since the consumers run asynchronously.
+            # Not an mmap: a watched file truncated under a live mapping would crash us with SIGBUS, where
+            # read() just comes up short.
+            while chunk := f.read(1 << 20):
+                for q in queues:
+                    q.put(chunk)
+                if progress_callback and total:
+                    done += len(chunk)
+                    progress_callback(done / total)
     except Exception as e:
-        return f"Error: {e}"
+        errors.append(e)
+    finally:
+        for q in queues:
+            q.put(None)
+        for thread in threads:
+            thread.join()
+
+    if errors:
+        error_text = f"Error: {errors[0]}"
+        return [error_text] * len(hashers), error_text, None
+    return [hasher.hexdigest() for hasher in hashers], _entropy_from_histogram(hist), hist
+
+# Result keys of FileAnalyzerThread stored in the analysis cache, in column order
+_ANALYSIS_CACHE_KEYS = ('sha256_hash', 'md5_hash', 'blake3_hash', 'entropy', 'byte_histogram')
+# Storage format of the cached byte histogram: 256 little-endian unsigned 64-bit counts
+_HISTOGRAM_STRUCT = struct.Struct('<256Q')
+
+def _open_analysis_cache():
+    """Opens the analysis cache database, creating its table on first use."""
+    conn = sqlite3.connect(ANALYSIS_CACHE_FILE, timeout=5)
+    conn.execute("CREATE TABLE IF NOT EXISTS hashes(path TEXT PRIMARY KEY, size INTEGER, mtime_ns INTEGER, "
+                 "sha256 TEXT, md5 TEXT, blake3 TEXT, entropy REAL, histogram BLOB)")
+    if 'histogram' not in {column[1] for column in conn.execute("PRAGMA table_info(hashes)")}:
+        conn.execute("ALTER TABLE hashes ADD COLUMN histogram BLOB") # Caches written before histograms were stored
+    return conn
+
+def load_cached_analysis(filepath, file_stat):
+    """
+    Returns the cached hashes, entropy and byte histogram of filepath as a dict of result keys (values that were
+    never computed are None), or None if the file changed since they were stored or the cache is unavailable.
+    """
+    try:
+        with contextlib.closing(_open_analysis_cache()) as conn:
+            row = conn.execute("SELECT sha256, md5, blake3, entropy, histogram FROM hashes WHERE path = ? AND size = ? AND mtime_ns = ?",
+                               (os.path.abspath(filepath), file_stat.st_size, file_stat.st_mtime_ns)).fetchone()
+    except sqlite3.Error:
+        return None
+    if not row:
+        return None
+    cached = dict(zip(_ANALYSIS_CACHE_KEYS, row))
+    if cached['byte_histogram'] is not None:
+        cached['byte_histogram'] = list(_HISTOGRAM_STRUCT.unpack(cached['byte_histogram']))
+    return cached
+
+def store_cached_analysis(filepath, file_stat, values):
+    """Stores the hashes, entropy and byte histogram in values (a dict of result keys) for filepath; failures are ignored."""
+    values = dict(values)
+    if values.get('byte_histogram') is not None:
+        values['byte_histogram'] = _HISTOGRAM_STRUCT.pack(*(int(count) for count in values['byte_histogram']))
+    try:
+        with contextlib.closing(_open_analysis_cache()) as conn, conn: # The inner 'conn' commits the transaction
+            conn.execute("INSERT OR REPLACE INTO hashes VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                         (os.path.abspath(filepath), file_stat.st_size, file_stat.st_mtime_ns,
+                          *(values.get(key) for key in _ANALYSIS_CACHE_KEYS)))
+    except sqlite3.Error:
+        pass
+
+# Fallback MIME types for extensions the mimetypes module doesn't know on every platform
+_CUSTOM_MIME_TYPES = {
+    '.json': 'application/json',
+    '.xml': 'application/xml',
+    '.csv': 'text/csv',
+    '.jpg': 'image/jpeg',
+    '.jpeg': 'image/jpeg',
+    '.png': 'image/png',
+    '.gif': 'image/gif',
+    '.bmp': 'image/bmp',
+    '.txt': 'text/plain',
+    '.bin': 'application/octet-stream',
+}
 
-def get_mime_type(filepath):
-    """Guesses the MIME type of a file. Adds custom types for common extensions."""
-    mime_type, _ = mimetypes.guess_type(filepath)
+@lru_cache(maxsize=1024)
+def _mime_from_suffixes(suffixes):
+    """Resolves the MIME type for a file name's suffixes (e.g. '.tar.gz'); cached since most files share a few."""
+    mime_type, _ = mimetypes.guess_type('file' + suffixes)
     if mime_type:
         return mime_type
-    _, ext = os.path.splitext(filepath)
-    ext = ext.lower()
-    # Custom MIME type mappings
-    if ext == '.json': return 'application/json'
-    if ext == '.xml': return 'application/xml'
-    if ext == '.csv': return 'text/csv'
-    if ext in ['.jpg', '.jpeg']: return 'image/jpeg'
-    if ext == '.png': return 'image/png'
-    if ext == '.gif': return 'image/gif'
-    if ext == '.bmp': return 'image/bmp'
-    if ext == '.txt': return 'text/plain'
-    if ext == '.bin': return 'application/octet-stream'
-    return 'application/octet-octet-stream'
+    ext = ('.' + suffixes.rsplit('.', 1)[-1]).lower() if suffixes else ''
+    return _CUSTOM_MIME_TYPES.get(ext, 'application/octet-octet-stream')
+
+def get_mime_type(filepath):
+    """Guesses the MIME type of a file. Adds custom types for common extensions."""
+    # Only the suffixes matter to the lookup (leading dots of hidden files are not one)
+    _, sep, suffixes = os.path.basename(filepath).lstrip('.').partition('.')
+    return _mime_from_suffixes('.' + suffixes if sep else '')
 
 # --- Threading for File Analysis ---
 
@@ -170,10 +592,12 @@ class FileAnalyzerThread(QThread):
     error = Signal(str)     # Emits error message string
     progress = Signal(int, str) # Emits progress percentage and message
 
-    def __init__(self, filepath, max_file_size_for_full_read, parent=None):
+    def __init__(self, filepath, max_file_size_for_full_read, compute_md5=True, max_file_size_for_md5=None, parent=None):
         super().__init__(parent)
         self.filepath = filepath
         self.max_file_size_for_full_read = max_file_size_for_full_read
+        self.compute_md5 = compute_md5
+        self.max_file_size_for_md5 = max_file_size_for_md5 # None means no size limit
 
     def run(self):
         """Performs the file analysis operations."""
@@ -190,21 +614,54 @@ class FileAnalyzerThread(QThread):
             results['mime_type'] = get_mime_type(self.filepath)
             self.progress.emit(10, self.tr("Basic info gathered."))
 
-            # Encoding Detection
-            encoding, confidence = detect_encoding(self.filepath)
+            # Encoding Detection runs on a helper thread while the file is hashed: chardet holds the GIL,
+            # but hashlib and NumPy release it, so the two overlap instead of adding up
+            encoding_thread = ThreadPoolExecutor(max_workers=1)
+            encoding_future = encoding_thread.submit(detect_encoding, self.filepath)
+            encoding_thread.shutdown(wait=False) # The thread exits once detection finishes
+
+            # Hash and Entropy Calculations: SHA-256, MD5 (unless disabled) and BLAKE3 (if installed) and the byte histogram
+            # share a single read of the file and run concurrently on their own threads
+            last_percent = [10]
+            def hash_progress(fraction):
+                percent = 10 + int(fraction * 80)
+                if percent != last_percent[0]: # Only signal when the bar would actually move
+                    last_percent[0] = percent
+                    self.progress.emit(percent, self.tr("Calculating hashes and entropy..."))
+            hash_keys = ['sha256_hash']
+            hash_algos = [hashlib.sha256]
+            if self.compute_md5 and (self.max_file_size_for_md5 is None or file_stat.st_size <= self.max_file_size_for_md5):
+                hash_keys.append('md5_hash')
+                hash_algos.append(hashlib.md5)
+            if BLAKE3_AVAILABLE:
+                hash_keys.append('blake3_hash')
+                hash_algos.append(partial(blake3, max_threads=blake3.AUTO)) # Hashes each chunk's tree on several cores
+            # Reopening an unchanged file reuses the stored values instead of reading it again
+            cached = load_cached_analysis(self.filepath, file_stat)
+            if cached and all(cached[key] is not None for key in hash_keys + ['byte_histogram']):
+                results.update((key, cached[key]) for key in hash_keys)
+                results['entropy'] = cached['entropy']
+                results['byte_histogram'] = cached['byte_histogram']
+                self.progress.emit(90, self.tr("Hashes and entropy loaded from cache."))
+            else:
+                digests, entropy, histogram = calculate_hashes_and_entropy(self.filepath, hash_algos, hash_progress)
+                results.update(zip(hash_keys, digests))
+                results['entropy'] = entropy
+                if histogram is not None:
+                    # Handed to the histogram tab and removed from the results before anything else sees them
+                    results['byte_histogram'] = histogram
+                if isinstance(entropy, float): # Errors come back as strings and are not cached
+                    values = dict(cached or {}) # Keep digests stored earlier but not computed this time
+                    values.update(zip(hash_keys, digests))
+                    values['entropy'] = entropy
+                    values['byte_histogram'] = histogram
+                    store_cached_analysis(self.filepath, file_stat, values)
+                self.progress.emit(90, self.tr("Hashes and entropy calculated."))
+
+            encoding, confidence = encoding_future.result()
             results['encoding'] = encoding
             results['encoding_confidence'] = confidence * 100 # Convert to percentage
-            self.progress.emit(30, self.tr("Encoding detected."))
-
-            # Hash Calculations
-            results['sha256_hash'] = calculate_hash(self.filepath, hashlib.sha256)
-            self.progress.emit(60, self.tr("SHA-256 calculated."))
-            results['md5_hash'] = calculate_hash(self.filepath, hashlib.md5)
-            self.progress.emit(90, self.tr("MD5 calculated."))
-
-            # Entropy Calculation
-            results['entropy'] = calculate_shannon_entropy(self.filepath)
-            self.progress.emit(95, self.tr("Entropy calculated."))
+            self.progress.emit(95, self.tr("Encoding detected."))
 
             # Image Metadata (if PIL is available and it's an image)
             if PIL_AVAILABLE and results['mime_type'].startswith('image/'):
@@ -213,47 +670,48 @@ class FileAnalyzerThread(QThread):
                         results['image_format'] = img.format
                         results['image_dimensions'] = f"{img.width}x{img.height}"
                         results['image_mode'] = img.mode
+                        exif = img.getexif() # Lazy mapping; only the tags we display get touched
                         exif_data = {}
-                        if hasattr(img, '_getexif'):
-                            raw_exif = img._getexif()
-                            if raw_exif is not None:
-                                for tag, value in raw_exif.items():
-                                    decoded = ExifTags.TAGS.get(tag, tag)
-                                    # Attempt to decode bytes to string for display
-                                    if isinstance(value, bytes):
-                                        try:
-                                            value = value.decode('utf-8', errors='ignore')
-                                        except:
-                                            pass
-                                    exif_data[decoded] = value
+                        for ifd in (exif, exif.get_ifd(ExifTags.IFD.Exif)):
+                            for tag, value in ifd.items():
+                                name = ExifTags.TAGS.get(tag)
+                                if name in _DISPLAYED_EXIF_TAGS:
+                                    exif_data[name] = float(value) if isinstance(value, IFDRational) else value
                         results['exif_data'] = exif_data
 
-                        # Extract GPS Info from EXIF
+                        # Extract GPS Info from the already-parsed GPS IFD
                         gps_info = {}
-                        if 'GPSInfo' in exif_data:
-                            gps_data = exif_data.get('GPSInfo', {}) # GPSInfo tag number
+                        gps_data = exif.get_ifd(ExifTags.IFD.GPSInfo)
+                        if gps_data:
                             # Latitude
                             if 1 in gps_data and 2 in gps_data:
                                 lat_ref = gps_data[1]
                                 lat_tuple = gps_data[2]
-                                latitude = sum(float(x) / 60**i for i, x in enumerate(lat_tuple))
+                                latitude = _dms_to_degrees(lat_tuple)
                                 if lat_ref == 'S': latitude = -latitude
                                 gps_info['Latitude'] = latitude
                             # Longitude
                             if 3 in gps_data and 4 in gps_data:
                                 lon_ref = gps_data[3]
                                 lon_tuple = gps_data[4]
-                                longitude = sum(float(x) / 60**i for i, x in enumerate(lon_tuple))
+                                longitude = _dms_to_degrees(lon_tuple)
                                 if lon_ref == 'W': longitude = -longitude
                                 gps_info['Longitude'] = longitude
                             # Altitude
                             if 5 in gps_data and 6 in gps_data:
                                 alt_ref = gps_data[5]
                                 altitude = gps_data[6]
-                                gps_info['Altitude'] = f"{altitude[0]/altitude[1]:.2f}m" if isinstance(altitude, tuple) else altitude
-                                if alt_ref == 1: gps_info['Altitude'] += " (below sea level)"
+                                gps_info['Altitude'] = f"{float(altitude):.2f}m" # Pillow hands back an IFDRational
+                                if alt_ref in (1, b'\x01'): gps_info['Altitude'] += " (below sea level)"
                         results['gps_data'] = gps_info
 
+                        # Scale down here so the UI thread never touches the full-resolution image
+                        try:
+                            preview = _read_scaled_image(self.filepath, QSize(IMAGE_PREVIEW_MAX_SIZE, IMAGE_PREVIEW_MAX_SIZE))
+                            results['image_preview'] = preview if not preview.isNull() else _image_preview(img)
+                        except Exception:
+                            pass # The tab falls back to loading the file itself
+
                 except Exception as e:
                     results['image_metadata_error'] = f"Could not read image metadata: {e}"
             self.progress.emit(98, self.tr("Image metadata processed."))
@@ -263,6 +721,68 @@ class FileAnalyzerThread(QThread):
         except Exception as e:
             self.error.emit(self.tr(f"Error during analysis: {e}")) # Emit error message
 
+class FileReadWorkerSignals(QObject):
+    """Defines the signals available from a running file read worker."""
+    finished = Signal(int, object, bool, object) # Emits generation, bytes read, is_large_file, content cache key
+    error = Signal(int, str)                     # Emits generation, error message string
+
+class FileReadWorker(QRunnable):
+    """
+    A QRunnable that re-reads the current file (or just its preview window) off the GUI thread.
+    The generation number lets the window drop results of reads that have since been superseded.
+    """
+    def __init__(self, generation, filepath, preview_cap, is_large_file, cache_key):
+        super().__init__()
+        self.generation = generation
+        self.filepath = filepath
+        self.preview_cap = preview_cap
+        self.is_large_file = is_large_file
+        self.cache_key = cache_key
+        self.signals = FileReadWorkerSignals()
+
+    def run(self):
+        """Reads the file and emits the bytes."""
+        try:
+            with io.open(self.filepath, 'rb', buffering=1 << 20) as f:
+                data = _read_preview_bytes(f, self.preview_cap)
+            self.signals.finished.emit(self.generation, data, self.is_large_file, self.cache_key)
+        except Exception as e:
+            self.signals.error.emit(self.generation, str(e))
+
+class Base64WorkerSignals(QObject):
+    """Defines the signals available from a running Base64 encoding worker."""
+    chunk_ready = Signal(int, str) # Emits generation, encoded text of the next chunk
+    finished = Signal(int)         # Emits generation
+    error = Signal(int, str)       # Emits generation, error message string
+
+class Base64Worker(QRunnable):
+    """
+    A QRunnable that Base64-encodes data chunk by chunk off the GUI thread.
+    Setting cancelled stops it before the next chunk.
+    """
+    def __init__(self, generation, data):
+        super().__init__()
+        self.generation = generation
+        self.data = data
+        self.cancelled = False
+        self.signals = Base64WorkerSignals()
+
+    def run(self):
+        """Encodes the data and emits it in chunks."""
+        b64encode = pybase64.b64encode if PYBASE64_AVAILABLE else base64.b64encode
+        try:
+            view = memoryview(self.data)
+            for start in range(0, len(view), BASE64_CHUNK_BYTES):
+                if self.cancelled:
+                    return
+                # The Base64 alphabet is pure ASCII
+                encoded = b64encode(view[start:start + BASE64_CHUNK_BYTES]).decode('ascii')
+                lines = [encoded[i:i + BASE64_LINE_CHARS] for i in range(0, len(encoded), BASE64_LINE_CHARS)]
+                self.signals.chunk_ready.emit(self.generation, "\n".join(lines))
+            self.signals.finished.emit(self.generation)
+        except Exception as e:
+            self.signals.error.emit(self.generation, str(e))
+
 # --- UI Tab Widgets ---
 
 class MetadataTab(QWidget):
@@ -282,6 +802,8 @@ class MetadataTab(QWidget):
             ("SHA-256 Hash", "sha256_hash"), ("MD5 Hash", "md5_hash"),
             ("Entropy", "entropy")
         ]
+        if BLAKE3_AVAILABLE:
+            fields.insert(-1, ("BLAKE3 Hash", "blake3_hash"))
 
         for display_name, key in fields:
             row_layout = QHBoxLayout()
@@ -307,32 +829,12 @@ class MetadataTab(QWidget):
         # Encoding confidence is already multiplied by 100 in FileAnalyzerThread
         self.labels['encoding_confidence'].setText(f"{metadata.get('encoding_confidence', 0.0):.2f}%")
         self.labels['sha256_hash'].setText(metadata.get('sha256_hash', self.tr("N/A")))
-        self.labels['md5_hash'].setText(metadata.get('md5_hash', self.tr("N/A")))
+        # A finished analysis without an MD5 means it was turned off in the settings or the file was over the limit
+        self.labels['md5_hash'].setText(metadata.get('md5_hash', self.tr("Disabled") if 'sha256_hash' in metadata else self.tr("N/A")))
+        if 'blake3_hash' in self.labels:
+            self.labels['blake3_hash'].setText(metadata.get('blake3_hash', self.tr("N/A")))
         self.labels['entropy'].setText(f"{metadata.get('entropy', 0.0):.4f}")
 
-class TextHighlighter(QSyntaxHighlighter):
-    """Custom syntax highlighter for text search results."""
-    def __init__(self, parent):
-        super().__init__(parent)
-        self.highlight_format = QTextCharFormat()
-        self.additional_highlights = [] # For multiple search matches
-
-    def highlightBlock(self, text):
-        """Applies highlighting to a block of text."""
-        for pos, length, fmt in self.additional_highlights:
-            # Check if the highlight range overlaps with the current text block
-            if pos <= self.currentBlock().position() + len(text) and pos + length >= self.currentBlock().position():
-                relative_start = max(0, pos - self.currentBlock().position())
-                relative_end = min(len(text), pos + length - self.currentBlock().position())
-                self.setFormat(relative_start, relative_end - relative_start, fmt)
-
-    def set_highlights(self, ranges_and_formats):
-        """Sets multiple highlight ranges with their formats."""
-        # ranges_and_formats is a list of (pos, length, QTextCharFormat) tuples
-        self.additional_highlights = ranges_and_formats
-        self.rehighlight() # Reapply all highlights
-
-
 class TextTab(QWidget):
     """Displays file content as text, with encoding selection and highlighting functionality."""
     text_content_changed = Signal(str) # New signal: Emits the decoded text content
@@ -370,39 +872,47 @@ class TextTab(QWidget):
         text_editor_layout.setContentsMargins(0,0,0,0)
         self.layout.addLayout(text_editor_layout)
 
-        self.text_editor.verticalScrollBar().valueChanged.connect(self.line_number_area.update)
-        self.text_editor.textChanged.connect(self.line_number_area.update)
-        self.text_editor.cursorPositionChanged.connect(self.line_number_area.update)
-        self.text_editor.document().blockCountChanged.connect(self.line_number_area._on_block_count_changed)
         self.text_editor.document().contentsChange.connect(self._handle_contents_change)
 
-        self.highlighter = TextHighlighter(self.text_editor.document())
+        # Search matches are shown as extra selections: overlays that don't re-run formatting of the document
+        self._current_match_format = QTextCharFormat()
+        self._current_match_format.setBackground(_CLR_CURRENT_MATCH_BG)
+        self._current_match_format.setForeground(_CLR_MATCH_TEXT)
+        self._other_match_format = QTextCharFormat()
+        self._other_match_format.setBackground(_CLR_OTHER_MATCH_BG)
+        self._other_match_format.setForeground(_CLR_MATCH_TEXT)
+        self._match_selections = [] # One ExtraSelection per search match, built once per result set
+        self._current_selection_index = -1
 
     def _handle_contents_change(self, position, charsRemoved, charsAdded):
         self.line_number_area.update_width()
         self.line_number_area.update()
 
-    def set_file_content(self, raw_bytes, encoding_hint=None, is_large=False, max_text_preview_lines=None):
+    def set_file_content(self, raw_bytes, encoding_hint=None, is_large=False, max_text_preview_lines=None, decoded_text=None):
+        """decoded_text, if given, is raw_bytes already decoded with encoding_hint and is used for the large-file preview."""
         self.file_content = raw_bytes
         self.is_large_file = is_large
         if max_text_preview_lines is not None:
             self.max_text_preview_lines = max_text_preview_lines
         
         # Clear existing highlights when new content is set
-        self.highlighter.set_highlights([])
+        self._clear_match_highlights()
 
         if is_large:
             display_text = self.tr(f"File too large for full display. Showing first {self.max_text_preview_lines} lines.\n")
             display_text += self.tr("--- Preview Mode ---\n")
+            # Only the first lines are shown, so only decode the bytes they can come from
+            preview_bytes = self.file_content[:self.max_text_preview_lines * ESTIMATED_BYTES_PER_LINE]
             try:
-                decoded_text = self.file_content.decode(encoding_hint or "utf-8", errors='replace')
+                if decoded_text is None:
+                    decoded_text = preview_bytes.decode(encoding_hint or "utf-8", errors='replace')
                 lines = decoded_text.splitlines()
                 display_text += "\n".join(lines[:self.max_text_preview_lines])
             except Exception as e:
                 display_text += self.tr(f"Could not decode preview with {encoding_hint}: {e}\n")
                 display_text += self.tr("Attempting with UTF-8...\n")
                 try:
-                    display_text += self.file_content.decode("utf-8", errors='replace')
+                    display_text += preview_bytes.decode("utf-8", errors='replace')
                 except Exception as e:
                     display_text += self.tr(f"Could not decode with UTF-8: {e}")
             self.text_editor.setPlainText(display_text)
@@ -422,12 +932,12 @@ class TextTab(QWidget):
             self.text_editor.verticalScrollBar().setValue(0)
             self.text_content_changed.emit(decoded_text) # Emit the full decoded text
             # Clear existing highlights when text is redecoded
-            self.highlighter.set_highlights([])
+            self._clear_match_highlights()
         except LookupError:
             error_text = self.tr(f"Error: Encoding '{encoding}' not supported by Python. Please choose another.")
             self.text_editor.setPlainText(error_text)
             self.text_content_changed.emit(error_text)
-            self.highlighter.set_highlights([])
+            self._clear_match_highlights()
         except Exception as e:
             error_text = self.tr(f"Error decoding with '{encoding}': {e}\n\nAttempting with UTF-8 (replace errors)...")
             try:
@@ -437,37 +947,47 @@ class TextTab(QWidget):
                 critical_error_text = self.tr(f"Critical Error: Could not decode with any fallback: {e_utf8}")
                 self.text_editor.setPlainText(critical_error_text)
                 self.text_content_changed.emit(critical_error_text)
-            self.highlighter.set_highlights([])
+            self._clear_match_highlights()
+
+    def _clear_match_highlights(self):
+        self._match_selections = []
+        self._current_selection_index = -1
+        self.text_editor.setExtraSelections([])
 
-    def highlight_matches(self, matches_data, current_match_index, query_length):
+    def set_match_highlights(self, matches_data, query_length):
         """
-        Applies highlighting to the QTextEdit based on search results.
+        Highlights a new set of search results; called once per search, not per navigation step.
         matches_data: List of (start_pos, line_number) tuples.
-        current_match_index: Index of the match to highlight differently.
         query_length: Length of the search query.
         """
-        all_highlights = []
-
-        # Format for the current match
-        current_match_format = QTextCharFormat()
-        current_match_format.setBackground(QColor("orange"))
-        current_match_format.setForeground(QColor("black"))
-
-        # Format for other matches
-        other_match_format = QTextCharFormat()
-        other_match_format.setBackground(QColor("yellow"))
-        other_match_format.setForeground(QColor("black"))
-
-        for i, (start_pos, _) in enumerate(matches_data):
-            fmt = current_match_format if i == current_match_index else other_match_format
-            all_highlights.append((start_pos, query_length, fmt))
-        
-        self.highlighter.set_highlights(all_highlights)
+        document = self.text_editor.document()
+        selections = []
+        for start_pos, _ in matches_data:
+            selection = QTextEdit.ExtraSelection()
+            selection.cursor = QTextCursor(document)
+            selection.cursor.setPosition(start_pos)
+            selection.cursor.setPosition(start_pos + query_length, QTextCursor.KeepAnchor)
+            selection.format = self._other_match_format
+            selections.append(selection)
+        self._match_selections = selections
+        self._current_selection_index = -1
+        self.text_editor.setExtraSelections(selections)
+
+    def set_current_match(self, current_match_index):
+        """Marks the match at current_match_index as current and scrolls to it; only two selections change."""
+        if self._current_selection_index != -1:
+            self._match_selections[self._current_selection_index].format = self._other_match_format
+        self._current_selection_index = -1
+        if 0 <= current_match_index < len(self._match_selections):
+            selection = self._match_selections[current_match_index]
+            selection.format = self._current_match_format
+            self._current_selection_index = current_match_index
+        self.text_editor.setExtraSelections(self._match_selections)
 
         # Scroll to the current match
-        if matches_data and current_match_index != -1:
+        if self._current_selection_index != -1:
             cursor = QTextCursor(self.text_editor.document())
-            cursor.setPosition(matches_data[current_match_index][0])
+            cursor.setPosition(selection.cursor.selectionStart())
             self.text_editor.setTextCursor(cursor)
             self.text_editor.ensureCursorVisible()
 
@@ -476,8 +996,8 @@ class LineNumberArea(QWidget):
     def __init__(self, editor):
         super().__init__(editor)
         self.editor = editor
+        # Text edits repaint through the owner's contentsChange handler, so scrolling and the cursor are enough here
         self.editor.verticalScrollBar().valueChanged.connect(self.update)
-        self.editor.textChanged.connect(self.update)
         self.editor.cursorPositionChanged.connect(self.update)
         self.editor.document().blockCountChanged.connect(self._on_block_count_changed)
         self.update_width()
@@ -493,42 +1013,39 @@ class LineNumberArea(QWidget):
 
     def paintEvent(self, event):
         painter = QPainter(self)
-        painter.fillRect(event.rect(), QColor(240, 240, 240))
+        painter.fillRect(event.rect(), _CLR_LINE_NUMBER_BG)
 
         if not self.editor or not self.editor.document():
             painter.end()
             return
 
-        block = self.editor.document().firstBlock() # Start from the first block
-        block_number = 0
+        document = self.editor.document()
+        layout = document.documentLayout()
         current_line_number = self.editor.textCursor().blockNumber() + 1
-
-        # Get the viewport's top and bottom y-coordinates
         viewport_top = self.editor.verticalScrollBar().value()
-        viewport_bottom = viewport_top + self.editor.viewport().height()
-
-        # Iterate through all blocks
+        viewport_height = self.editor.viewport().height()
+        text_width = self.width() - 5
+        normal_font = painter.font()
+        bold_font = QFont(normal_font)
+        bold_font.setBold(True)
+        normal_pen = _CLR_LINE_NUMBER
+        current_pen = _CLR_CURRENT_LINE_NUMBER
+
+        # Start at the block under the top of the viewport instead of walking the document from its first block
+        block = self.editor.cursorForPosition(QPoint(0, 0)).block()
         while block.isValid():
-            block_number += 1
-            # Get the block's bounding rectangle in document coordinates
-            block_rect = self.editor.document().documentLayout().blockBoundingRect(block)
-            
-            # Convert block_rect to viewport coordinates
+            # Convert the block's document rectangle to viewport coordinates
+            block_rect = layout.blockBoundingRect(block)
             block_top_in_viewport = block_rect.top() - viewport_top
-            block_bottom_in_viewport = block_rect.bottom() - viewport_top
-
-            # Only draw if the block is visible in the viewport
-            if block_bottom_in_viewport >= 0 and block_top_in_viewport <= self.editor.viewport().height():
-                number = str(block_number)
-                painter.setPen(QColor(120, 120, 120))
-                if block_number == current_line_number:
-                    painter.setPen(QColor("blue"))
-                    painter.setFont(QFont(painter.font().family(), painter.font().pointSize(), QFont.Bold))
-
-                # Draw the text at the calculated position
-                painter.drawText(0, int(block_top_in_viewport), self.width() - 5, int(block_rect.height()),
-                                 Qt.AlignRight | Qt.AlignVCenter, number)
-            
+            if block_top_in_viewport > viewport_height:
+                break # Everything after this is below the viewport
+            if block_rect.bottom() - viewport_top >= 0:
+                block_number = block.blockNumber() + 1
+                is_current = block_number == current_line_number
+                painter.setPen(current_pen if is_current else normal_pen)
+                painter.setFont(bold_font if is_current else normal_font)
+                painter.drawText(0, int(block_top_in_viewport), text_width, int(block_rect.height()),
+                                 Qt.AlignRight | Qt.AlignVCenter, str(block_number))
             block = block.next()
         painter.end()
 
@@ -539,6 +1056,54 @@ class LineNumberArea(QWidget):
                 self.setFixedWidth(width)
 
 
+class HexTableModel(QAbstractTableModel):
+    """
+    Table model for the hex view: one row per line of bytes, with offset, hex and ASCII columns.
+    Cells are formatted on demand, so only the rows in the viewport are ever turned into text.
+    """
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.byte_data = b""
+        self.bytes_per_line = 16
+
+    def set_data(self, byte_data, bytes_per_line):
+        self.beginResetModel()
+        self.byte_data = byte_data
+        self.bytes_per_line = bytes_per_line
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return (len(self.byte_data) + self.bytes_per_line - 1) // self.bytes_per_line
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else 3
+
+    def line_text(self, row):
+        """Returns the (offset, hex, ascii) strings of a row."""
+        start = row * self.bytes_per_line
+        chunk = self.byte_data[start:start + self.bytes_per_line]
+        # Formatting and translating run in C rather than once per byte. Non-printable bytes are
+        # shown as '.' whether or not "Show non-printables" is checked, so one table serves both modes.
+        return f'{start:08x}', chunk.hex(' '), chunk.translate(_HEX_ASCII_TABLE).decode('latin-1')
+
+    def data(self, index, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole or not index.isValid():
+            return None
+        # The view asks for each cell separately, so format just that column rather than the whole row
+        column = index.column()
+        start = index.row() * self.bytes_per_line
+        if column == 0:
+            return f'{start:08x}'
+        chunk = self.byte_data[start:start + self.bytes_per_line]
+        return chunk.hex(' ') if column == 1 else chunk.translate(_HEX_ASCII_TABLE).decode('latin-1')
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return (self.tr("Offset"), self.tr("Hex"), self.tr("ASCII"))[section]
+        return None
+
 class HexView(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -565,12 +1130,25 @@ class HexView(QWidget):
         control_layout.addStretch(1)
         self.layout.addLayout(control_layout)
 
-        self.hex_editor = QTextEdit()
-        self.hex_editor.setReadOnly(True)
-        self.hex_editor.setFont(QFont("Monospace", 9))
-        self.hex_editor.setLineWrapMode(QTextEdit.NoWrap)
-        self.hex_editor.setTextInteractionFlags(Qt.TextSelectableByMouse)
-        self.layout.addWidget(self.hex_editor)
+        # Shown above the table when only a preview of a large file is displayed
+        self.preview_notice_label = QLabel()
+        self.preview_notice_label.hide()
+        self.layout.addWidget(self.preview_notice_label)
+
+        # A virtualized table instead of one big text document: scrolling cost no longer depends on the data size
+        self.hex_model = HexTableModel(self)
+        self.hex_table = QTableView()
+        self.hex_table.setModel(self.hex_model)
+        self.hex_table.setFont(QFont("Monospace", 9))
+        self.hex_table.setEditTriggers(QTableView.NoEditTriggers)
+        self.hex_table.setSelectionBehavior(QTableView.SelectRows)
+        self.hex_table.setWordWrap(False)
+        self.hex_table.setShowGrid(False)
+        self.hex_table.verticalHeader().setVisible(False)
+        self.hex_table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed) # Uniform rows, no per-row measuring
+        self.hex_table.verticalHeader().setDefaultSectionSize(self.hex_table.fontMetrics().height() + 4)
+        self.hex_table.horizontalHeader().setStretchLastSection(True)
+        self.layout.addWidget(self.hex_table)
 
     def set_file_content(self, raw_bytes, is_large=False, max_hex_preview_bytes=None):
         self.file_content = raw_bytes
@@ -579,29 +1157,40 @@ class HexView(QWidget):
             self.max_hex_preview_bytes = max_hex_preview_bytes
         self._update_hex_display()
 
+    def _preview_notice(self):
+        return self.tr("File too large for full hex dump. Showing first {0} bytes.\n").format(self.max_hex_preview_bytes) + self.tr("--- Preview Mode ---\n")
+
     def _update_hex_display(self):
         bytes_per_line = int(self.width_combo.currentText())
-        show_non_printables = self.toggle_non_printables_checkbox.isChecked()
-        hex_output = []
         data_to_display = self.file_content
 
         if self.is_large_file:
             data_to_display = self.file_content[:self.max_hex_preview_bytes]
-            hex_output.append(self.tr(f"File too large for full hex dump. Showing first {self.max_hex_preview_bytes} bytes.\n"))
-            hex_output.append(self.tr("--- Preview Mode ---\n"))
-
-        for i in range(0, len(data_to_display), bytes_per_line):
-            chunk = data_to_display[i:i + bytes_per_line]
-            hex_part = ' '.join(f'{byte:02x}' for byte in chunk)
-            ascii_part = ''
-            for byte in chunk:
-                if 32 <= byte <= 126 or (show_non_printables and byte in range(0, 256)):
-                    ascii_part += chr(byte) if 32 <= byte <= 126 else '.'
-                else:
-                    ascii_part += '.'
-            hex_output.append(f'{i:08x}: {hex_part.ljust(bytes_per_line * 3 - 1)} | {ascii_part}')
-        self.hex_editor.setPlainText('\n'.join(hex_output))
-        self.hex_editor.verticalScrollBar().setValue(0)
+            self.preview_notice_label.setText(self._preview_notice().strip())
+            self.preview_notice_label.show()
+        else:
+            self.preview_notice_label.hide()
+
+        self.hex_model.set_data(data_to_display, bytes_per_line)
+        self.hex_table.resizeColumnToContents(0)
+        self.hex_table.resizeColumnToContents(1)
+        self.hex_table.scrollToTop()
+
+    def hex_text(self, max_chars=None):
+        """Returns the displayed dump as plain text (e.g. for exports), formatting only rows up to max_chars."""
+        model = self.hex_model
+        hex_width = model.bytes_per_line * 3 - 1
+        hex_output = [self._preview_notice()] if self.is_large_file else []
+        length = len(hex_output[0]) if hex_output else 0
+        for row in range(model.rowCount()):
+            if max_chars is not None and length >= max_chars:
+                break
+            offset, hex_part, ascii_part = model.line_text(row)
+            line = f'{offset}: {hex_part.ljust(hex_width)} | {ascii_part}'
+            hex_output.append(line)
+            length += len(line) + 1
+        text = '\n'.join(hex_output)
+        return text if max_chars is None else text[:max_chars]
 
 class StructuredView(QWidget):
     def __init__(self, parent=None):
@@ -612,8 +1201,8 @@ class StructuredView(QWidget):
         self.stacked_widget = QStackedWidget()
         self.layout.addWidget(self.stacked_widget)
 
-        # Text editor for JSON, XML, or general text
-        self.text_editor = QTextEdit()
+        # Text editor for JSON, XML, or general text; plain-text layout is much cheaper for large documents
+        self.text_editor = QPlainTextEdit()
         self.text_editor.setReadOnly(True)
         self.text_editor.setFont(QFont("Monospace", 10))
         self.text_editor.setTextInteractionFlags(Qt.TextSelectableByMouse)
@@ -631,7 +1220,8 @@ class StructuredView(QWidget):
 
         self.max_structured_preview_lines = DEFAULT_APP_SETTINGS['MAX_STRUCTURED_PREVIEW_LINES'] # Default value
 
-    def set_file_content(self, raw_bytes, mime_type, encoding_hint="utf-8", is_large=False, max_structured_preview_lines=None):
+    def set_file_content(self, raw_bytes, mime_type, encoding_hint="utf-8", is_large=False, max_structured_preview_lines=None, decoded_text=None):
+        """decoded_text, if given, is raw_bytes already decoded with encoding_hint and skips decoding here."""
         self.text_editor.clear()
         self.table_widget.clear()
         self.table_widget.setRowCount(0)
@@ -639,20 +1229,26 @@ class StructuredView(QWidget):
         if max_structured_preview_lines is not None:
             self.max_structured_preview_lines = max_structured_preview_lines
 
-        decoded_content = ""
-        try:
-            decoded_content = raw_bytes.decode(encoding_hint, errors='replace')
-        except Exception:
+        decoded_content = decoded_text if decoded_text is not None else ""
+        if decoded_text is None:
+            if is_large and 'json' not in mime_type:
+                # XML, CSV and text previews only read the start of the file, so don't decode all of it;
+                # JSON has to be parsed as a whole document
+                raw_bytes = raw_bytes[:self.max_structured_preview_lines * ESTIMATED_BYTES_PER_LINE]
             try:
-                decoded_content = raw_bytes.decode("utf-8", errors='replace')
-            except Exception as e:
-                self.text_editor.setPlainText(self.tr(f"Could not decode file to text: {e}"))
-                self.stacked_widget.setCurrentIndex(0)
-                return
+                decoded_content = raw_bytes.decode(encoding_hint, errors='replace')
+            except Exception:
+                try:
+                    decoded_content = raw_bytes.decode("utf-8", errors='replace')
+                except Exception as e:
+                    self.text_editor.setPlainText(self.tr(f"Could not decode file to text: {e}"))
+                    self.stacked_widget.setCurrentIndex(0)
+                    return
+        raw_preview = decoded_content[:1000] # Context shown by the error messages below
 
         if 'json' in mime_type:
             try:
-                data = json.loads(decoded_content)
+                data, parsed_with_orjson = _parse_json(decoded_content)
                 # Attempt to display as table if it's a list of dicts or a single dict
                 if isinstance(data, list) and all(isinstance(item, dict) for item in data):
                     self.stacked_widget.setCurrentIndex(1) # Show table
@@ -669,40 +1265,39 @@ class StructuredView(QWidget):
                 else:
                     # Fallback to text for other JSON types (e.g., list of primitives, string, number)
                     self.stacked_widget.setCurrentIndex(0)
-                    pretty_json = json.dumps(data, indent=4, ensure_ascii=False)
+                    pretty_json = _pretty_json(data, parsed_with_orjson)
                     if is_large:
-                        lines = pretty_json.splitlines()
-                        self.text_editor.setPlainText(self.tr(f"File too large for full structured display. Showing first {self.max_structured_preview_lines} lines.\n\n--- Preview Mode ---\n") + "\n".join(lines[:self.max_structured_preview_lines]))
+                        self.text_editor.setPlainText(self.tr(f"File too large for full structured display. Showing first {self.max_structured_preview_lines} lines.\n\n--- Preview Mode ---\n") + _first_lines(pretty_json, self.max_structured_preview_lines))
                     else:
                         self.text_editor.setPlainText(pretty_json)
             except json.JSONDecodeError as e:
                 self.stacked_widget.setCurrentIndex(0)
-                self.text_editor.setPlainText(self.tr(f"Invalid JSON: {e}\n\nRaw content:\n{decoded_content[:1000]}..."))
+                self.text_editor.setPlainText(self.tr(f"Invalid JSON: {e}\n\nRaw content:\n{raw_preview}..."))
             except Exception as e:
                 self.stacked_widget.setCurrentIndex(0)
-                self.text_editor.setPlainText(self.tr(f"Error processing JSON: {e}\n\nRaw content:\n{decoded_content[:1000]}..."))
+                self.text_editor.setPlainText(self.tr(f"Error processing JSON: {e}\n\nRaw content:\n{raw_preview}..."))
         elif 'xml' in mime_type:
             self.stacked_widget.setCurrentIndex(0)
             try:
-                root = ET.fromstring(decoded_content)
-                # Use ET.indent for pretty printing if available (Python 3.9+)
-                # Otherwise, just use tostring without pretty_print
-                if hasattr(ET, 'indent'):
-                    ET.indent(root, space="  ", level=0)
-                    pretty_xml = ET.tostring(root, encoding='unicode')
-                else:
-                    pretty_xml = ET.tostring(root, encoding='unicode') # Removed pretty_print
-                
                 if is_large:
-                    lines = pretty_xml.splitlines()
-                    self.text_editor.setPlainText(self.tr(f"File too large for full structured display. Showing first {self.max_structured_preview_lines} lines.\n\n--- Preview Mode ---\n") + "\n".join(lines[:self.max_structured_preview_lines]))
+                    # Stream the preview instead of building and pretty-printing the whole (possibly cut off) tree
+                    preview_xml = "\n".join(_xml_preview_lines(decoded_content, self.max_structured_preview_lines))
+                    self.text_editor.setPlainText(self.tr(f"File too large for full structured display. Showing first {self.max_structured_preview_lines} lines.\n\n--- Preview Mode ---\n") + preview_xml)
                 else:
+                    root = ET.fromstring(decoded_content)
+                    # Use ET.indent for pretty printing if available (Python 3.9+)
+                    # Otherwise, just use tostring without pretty_print
+                    if hasattr(ET, 'indent'):
+                        ET.indent(root, space="  ", level=0)
+                        pretty_xml = ET.tostring(root, encoding='unicode')
+                    else:
+                        pretty_xml = ET.tostring(root, encoding='unicode') # Removed pretty_print
                     self.text_editor.setPlainText(pretty_xml)
             except ET.ParseError as e:
-                self.text_editor.setPlainText(self.tr(f"Invalid XML: {e}\n\nRaw content:\n{decoded_content[:1000]}..."))
+                self.text_editor.setPlainText(self.tr(f"Invalid XML: {e}\n\nRaw content:\n{raw_preview}..."))
             except Exception as e:
                 error_details = traceback.format_exc()
-                self.text_editor.setPlainText(self.tr(f"Error processing XML: {e}\nDetails:\n{error_details}\n\nRaw content:\n{decoded_content[:1000]}..."))
+                self.text_editor.setPlainText(self.tr(f"Error processing XML: {e}\nDetails:\n{error_details}\n\nRaw content:\n{raw_preview}..."))
         elif 'csv' in mime_type or (mime_type == 'text/plain' and any(c in decoded_content[:1024] for c in [',', '\t', ';'])): # Heuristic for plain text that might be CSV
             try:
                 f = io.StringIO(decoded_content)
@@ -717,7 +1312,9 @@ class StructuredView(QWidget):
                 except csv.Error as e:
                     pass 
 
-                reader = csv.reader(f, dialect)
+                # Unquoted CSV (the common case) is split with C string methods instead of the csv state machine
+                rows = _split_simple_csv(decoded_content, dialect)
+                reader = iter(rows) if rows is not None else csv.reader(f, dialect)
                 
                 header = []
                 data = []
@@ -733,7 +1330,9 @@ class StructuredView(QWidget):
                         if any(isinstance(item, str) and not item.strip().replace('.', '', 1).isdigit() for item in first_row):
                             is_likely_header = True
                         
-                        if is_likely_header and len(decoded_content.splitlines()) > 1: # Also check if there's more than one line
+                        # Also check if there's more than one line, without splitting the whole content into lines
+                        content_body = decoded_content.rstrip('\r\n')
+                        if is_likely_header and ('\n' in content_body or '\r' in content_body):
                             header = first_row
                         else:
                             data.append(first_row)
@@ -741,9 +1340,8 @@ class StructuredView(QWidget):
                         # If has_header itself fails, assume no header and treat as data
                         data.append(first_row)
                 
-                # Read remaining data
-                for row in reader:
-                    data.append(row)
+                # Read remaining data; large previews stop one row past the limit (enough to tell they were cut)
+                data.extend(islice(reader, self.max_structured_preview_lines + 1) if is_large else reader)
 
                 # Determine the maximum number of columns needed
                 max_cols = len(header) if header else 0
@@ -778,7 +1376,7 @@ class StructuredView(QWidget):
 
             except Exception as e: # Catch broader exceptions for debugging
                 error_details = traceback.format_exc()
-                self.text_editor.setPlainText(self.tr(f"Could not parse as CSV. Trying to display as plain text.\nError: {e}\nDetails:\n{error_details}\n\nRaw content:\n{decoded_content[:1000]}..."))
+                self.text_editor.setPlainText(self.tr(f"Could not parse as CSV. Trying to display as plain text.\nError: {e}\nDetails:\n{error_details}\n\nRaw content:\n{raw_preview}..."))
                 self.stacked_widget.setCurrentIndex(0) # Show text editor
         else:
             # Default to text editor for unsupported or plain text
@@ -843,7 +1441,7 @@ class ImageMetadataTab(QWidget):
         self.metadata_text_edit.setTextInteractionFlags(Qt.TextSelectableByMouse)
         self.layout.addWidget(self.metadata_text_edit)
 
-    def update_image_data(self, filepath, metadata):
+    def update_image_data(self, filepath, metadata, preview_image=None):
         self.image_label.clear()
         self.metadata_text_edit.clear()
 
@@ -856,7 +1454,10 @@ class ImageMetadataTab(QWidget):
             return
 
         try:
-            pixmap = QPixmap(filepath)
+            # The analysis thread already shrank the image; otherwise decode the file straight to the label's size
+            if preview_image is None:
+                preview_image = _read_scaled_image(filepath, self.image_label.size())
+            pixmap = QPixmap.fromImage(preview_image)
             if not pixmap.isNull():
                 scaled_pixmap = pixmap.scaled(self.image_label.size(), Qt.KeepAspectRatio, Qt.SmoothTransformation)
                 self.image_label.setPixmap(scaled_pixmap)
@@ -893,28 +1494,83 @@ class Base64View(QWidget):
         self.encode_button.clicked.connect(self._encode_file)
         self.layout.addWidget(self.encode_button)
 
-        self.base64_text_edit = QTextEdit()
+        self.base64_text_edit = QPlainTextEdit() # No rich-text layout for multi-megabyte text
         self.base64_text_edit.setReadOnly(True)
         self.base64_text_edit.setFont(QFont("Monospace", 9))
         self.base64_text_edit.setTextInteractionFlags(Qt.TextSelectableByMouse)
+        self.base64_text_edit.textChanged.connect(self._invalidate_preview)
         self.layout.addWidget(self.base64_text_edit)
 
         self.file_content = b""
+        self.thread_pool = QThreadPool(self) # Encoding jobs for this tab
+        self._encode_worker = None # The running Base64Worker, if any
+        self._encode_generation = 0 # Bumped whenever running encodes become stale
+        self._preview = None # (max_chars, text) last returned by preview_text, until the text changes
 
     def set_file_content(self, raw_bytes):
+        self._cancel_encoding()
         self.file_content = raw_bytes
         self.base64_text_edit.clear()
 
+    def preview_text(self, max_chars):
+        """Returns the first max_chars characters of the encoded text, reusing the last result until it changes."""
+        if self._preview is None or self._preview[0] != max_chars:
+            self._preview = (max_chars, _head_text(self.base64_text_edit, max_chars))
+        return self._preview[1]
+
+    def _invalidate_preview(self):
+        self._preview = None
+
+    def _cancel_encoding(self):
+        """Stops a running encode and makes its remaining chunks stale."""
+        self._encode_generation += 1
+        if self._encode_worker is not None:
+            self._encode_worker.cancelled = True
+            self._encode_worker = None
+            self._finish_encoding()
+
     def _encode_file(self):
         if not self.file_content:
             self.base64_text_edit.setPlainText(self.tr("No file loaded to encode."))
             return
-        try:
-            encoded_data = base64.b64encode(self.file_content).decode('utf-8')
-            self.base64_text_edit.setPlainText(encoded_data)
-        except Exception as e:
-            self.base64_text_edit.setPlainText(self.tr(f"Error encoding to Base64: {e}"))
+        self._cancel_encoding()
+        self.base64_text_edit.clear()
+        data = self.file_content
+        if len(data) > MAX_BASE64_PREVIEW_BYTES:
+            data = data[:MAX_BASE64_PREVIEW_BYTES]
+            self.base64_text_edit.setPlainText(self.tr("File too large for full Base64 display. Showing first {0}.\n--- Preview Mode ---").format(human_readable_size(MAX_BASE64_PREVIEW_BYTES)))
+        # Encode on the pool and append the text chunk by chunk, repainting only once it is all in
+        self.encode_button.setEnabled(False)
+        self.base64_text_edit.setUpdatesEnabled(False)
+        worker = Base64Worker(self._encode_generation, data)
+        worker.signals.chunk_ready.connect(self._on_chunk_encoded)
+        worker.signals.finished.connect(self._on_encoding_finished)
+        worker.signals.error.connect(self._on_encoding_error)
+        self._encode_worker = worker
+        self.thread_pool.start(worker)
+
+    @Slot(int, str)
+    def _on_chunk_encoded(self, generation, text):
+        if generation == self._encode_generation:
+            self.base64_text_edit.appendPlainText(text)
+
+    @Slot(int)
+    def _on_encoding_finished(self, generation):
+        if generation == self._encode_generation:
+            self._encode_worker = None
+            self._finish_encoding()
+
+    @Slot(int, str)
+    def _on_encoding_error(self, generation, message):
+        if generation == self._encode_generation:
+            self._encode_worker = None
+            self.base64_text_edit.setPlainText(self.tr("Error encoding to Base64: {0}").format(message))
+            self._finish_encoding()
+
+    def _finish_encoding(self):
+        self.base64_text_edit.setUpdatesEnabled(True)
         self.base64_text_edit.verticalScrollBar().setValue(0)
+        self.encode_button.setEnabled(True)
 
 class EntropyTab(QWidget):
     def __init__(self, parent=None):
@@ -953,7 +1609,8 @@ class ByteHistogram(QWidget):
         else:
             self.layout.addWidget(QLabel(self.tr("Matplotlib not found. Byte Histogram feature is disabled.")))
 
-    def plot_histogram(self, file_content):
+    def plot_histogram(self, file_content, byte_counts=None):
+        """byte_counts, if given, is the 256-bin histogram of file_content already counted elsewhere."""
         if not MATPLOTLIB_AVAILABLE:
             return
 
@@ -971,9 +1628,10 @@ class ByteHistogram(QWidget):
             self.canvas.draw()
             return
 
-        byte_counts = [0] * 256
-        for byte in file_content:
-            byte_counts[byte] += 1
+        if byte_counts is None:
+            # Same counting kernel as the entropy calculation (NumPy/Numba when installed)
+            byte_counts = _new_byte_histogram()
+            _update_byte_histogram(byte_counts, file_content)
 
         self.ax.bar(range(256), byte_counts, width=1.0, color='skyblue', edgecolor='blue')
         self.canvas.draw()
@@ -1074,19 +1732,18 @@ class PluginManager(QObject):
 
     def _load_history(self):
         """Loads plugin history from a JSON file into in-memory list."""
-        if os.path.exists(PLUGIN_HISTORY_FILE):
-            try:
-                with open(PLUGIN_HISTORY_FILE, 'r', encoding='utf-8') as f:
-                    self.history_entries = json.load(f)
-                self._log(self.tr("Loaded plugin history from file."))
-            except json.JSONDecodeError as e:
-                self._log(self.tr(f"Error reading plugin history file (JSON error): {e}"))
-                self.history_entries = [] # Reset on error
-            except Exception as e:
-                self._log(self.tr(f"Error loading plugin history: {e}"))
-                self.history_entries = [] # Reset on error
-        else:
+        try: # A missing file raises on open instead of costing a separate existence check
+            with open(PLUGIN_HISTORY_FILE, 'r', encoding='utf-8') as f:
+                self.history_entries = json.load(f)
+            self._log(self.tr("Loaded plugin history from file."))
+        except FileNotFoundError:
             self._log(self.tr("No plugin history file found."))
+        except json.JSONDecodeError as e:
+            self._log(self.tr(f"Error reading plugin history file (JSON error): {e}"))
+            self.history_entries = [] # Reset on error
+        except Exception as e:
+            self._log(self.tr(f"Error loading plugin history: {e}"))
+            self.history_entries = [] # Reset on error
 
     def _save_history(self):
         """Saves current plugin history to a JSON file."""
@@ -1216,7 +1873,8 @@ class PluginManager(QObject):
                 'description': description,
                 'json_path': os.path.join(PLUGIN_DIRECTORY, f"{name}.infoscava"), # Ensure correct json_path
                 'plugin_py_path': plugin_py_path,
-                'tab_title': tab_title
+                'tab_title': tab_title,
+                'mtime': os.stat(plugin_py_path).st_mtime_ns # Lets the main window tell whether a reload changed anything
             }
             self._log(self.tr(f"Successfully loaded plugin: {name} (Type: {plugin_type}) from {os.path.basename(plugin_py_path)}."))
             self.plugin_loaded_signal.emit(name)
@@ -1511,28 +2169,25 @@ class SettingsManager(QObject):
 
     def _load_settings(self):
         """Loads settings from file or returns defaults."""
-        if os.path.exists(APP_SETTINGS_FILE):
-            try:
-                with open(APP_SETTINGS_FILE, 'r', encoding='utf-8') as f:
-                    loaded_settings = json.load(f)
-                # Validate loaded settings and apply defaults for missing keys
-                for key, default_value in DEFAULT_APP_SETTINGS.items():
-                    # Ensure key exists, is numeric, and for positive-only settings, check if > 0
-                    if key not in loaded_settings or not isinstance(loaded_settings[key], (int, float)):
-                        loaded_settings[key] = default_value
-                    elif key in ['MAX_TEXT_PREVIEW_LINES', 'MAX_HEX_PREVIEW_BYTES', 'MAX_STRUCTURED_PREVIEW_LINES', 'MAX_PLUGIN_HISTORY_ENTRIES'] and loaded_settings[key] <= 0:
-                        loaded_settings[key] = default_value
-                return loaded_settings
-            except (json.JSONDecodeError, FileNotFoundError, Exception) as e:
-                # print(f"Error loading settings: {e}. Using default settings.")
-                return DEFAULT_APP_SETTINGS.copy()
-        return DEFAULT_APP_SETTINGS.copy()
+        try: # A missing file lands in the except below, so no separate existence check is needed
+            with open(APP_SETTINGS_FILE, 'r', encoding='utf-8') as f:
+                loaded_settings = json.load(f)
+            # Validate loaded settings and apply defaults for missing keys
+            for key, default_value in DEFAULT_APP_SETTINGS.items():
+                # Ensure key exists, is numeric, and for positive-only settings, check if > 0
+                if key not in loaded_settings or not isinstance(loaded_settings[key], (int, float)):
+                    loaded_settings[key] = default_value
+                elif key in ['MAX_TEXT_PREVIEW_LINES', 'MAX_HEX_PREVIEW_BYTES', 'MAX_STRUCTURED_PREVIEW_LINES', 'MAX_PLUGIN_HISTORY_ENTRIES', 'MAX_FILE_SIZE_FOR_MD5'] and loaded_settings[key] <= 0:
+                    loaded_settings[key] = default_value
+            return loaded_settings
+        except (json.JSONDecodeError, FileNotFoundError, Exception) as e:
+            # print(f"Error loading settings: {e}. Using default settings.")
+            return DEFAULT_APP_SETTINGS.copy()
 
     def save_settings(self, settings):
         """Saves current settings to file."""
         try:
-            with open(APP_SETTINGS_FILE, 'w', encoding='utf-8') as f:
-                json.dump(settings, f, indent=4, ensure_ascii=False)
+            _atomic_write_json(APP_SETTINGS_FILE, settings, indent=4, ensure_ascii=False)
             self.settings = settings.copy() # Update in-memory settings
         except Exception as e:
             # print(f"Error saving settings: {e}")
@@ -1587,6 +2242,18 @@ class SettingsDialog(QDialog):
             self.form_layout.addRow(label_text, spinbox)
             self.widgets[key] = spinbox
 
+        # MD5 hashing
+        self.compute_md5_checkbox = QCheckBox(self.tr("Compute MD5 hash"))
+        self.compute_md5_checkbox.setChecked(bool(self.current_settings.get('COMPUTE_MD5', DEFAULT_APP_SETTINGS['COMPUTE_MD5'])))
+        self.form_layout.addRow(self.tr("MD5 Hash:"), self.compute_md5_checkbox)
+        self.md5_size_spinbox = QSpinBox()
+        self.md5_size_spinbox.setRange(1, 10000000) # In MB
+        self.md5_size_spinbox.setSuffix(" MB")
+        self.md5_size_spinbox.setValue(max(1, self.current_settings.get('MAX_FILE_SIZE_FOR_MD5', DEFAULT_APP_SETTINGS['MAX_FILE_SIZE_FOR_MD5']) // (1024 * 1024)))
+        self.md5_size_spinbox.setEnabled(self.compute_md5_checkbox.isChecked())
+        self.compute_md5_checkbox.toggled.connect(self.md5_size_spinbox.setEnabled)
+        self.form_layout.addRow(self.tr("Skip MD5 for Files Over:"), self.md5_size_spinbox)
+
         button_layout = QHBoxLayout()
         save_button = QPushButton(self.tr("Save"))
         save_button.clicked.connect(self._save_settings)
@@ -1639,6 +2306,9 @@ class SettingsDialog(QDialog):
                 if value <= 0:
                     raise ValueError(f"{self.tr(key.replace('_', ' ').title())} must be a positive number.")
                 new_settings[key] = value
+
+            new_settings['COMPUTE_MD5'] = self.compute_md5_checkbox.isChecked()
+            new_settings['MAX_FILE_SIZE_FOR_MD5'] = self.md5_size_spinbox.value() * 1024 * 1024
             
             self.settings_saved.emit(new_settings)
             self.accept()
@@ -1876,35 +2546,20 @@ class SearchWorker(QRunnable):
 
         text_lower = self.text_content.lower()
         query_lower = self.query.lower()
-        
-        current_pos = 0
-        line_number = 1
-        
-        # Pre-calculate line start positions for efficient line number lookup
-        line_start_positions = [0]
-        for char in self.text_content:
-            if char == '\n':
-                line_start_positions.append(current_pos + 1)
-            current_pos += 1
 
+        # One C-level substring scan; line numbers are tracked incrementally by counting the newlines
+        # between consecutive matches instead of walking a table of line starts for every match
         current_pos = 0
+        line_number = 1
+        counted_up_to = 0
         while True:
             idx = text_lower.find(query_lower, current_pos)
             if idx == -1:
                 break
-            
-            # Find line number for the match
-            # This is a bit inefficient for very large files, but acceptable for typical text sizes.
-            # A more optimized approach would be to track line numbers during the find loop.
-            match_line_number = 1
-            for i in range(len(line_start_positions)):
-                if line_start_positions[i] > idx:
-                    match_line_number = i
-                    break
-                match_line_number = len(line_start_positions) # If match is on the last line
-
-            matches.append((idx, match_line_number))
-            current_pos = idx + self.query_length
+            line_number += text_lower.count('\n', counted_up_to, idx)
+            counted_up_to = idx
+            matches.append((idx, line_number))
+            current_pos = idx + max(1, self.query_length)
 
         self.signals.finished.emit(matches, self.query, self.query_length)
 
@@ -1917,7 +2572,8 @@ class SearchTab(QWidget):
     A new tab for performing text search on the content of the TextTab.
     Uses multi-threading for search operations.
     """
-    highlight_requested = Signal(list, int, int) # Emits (matches_data, current_match_index, query_length)
+    matches_changed = Signal(list, int) # Emits (matches_data, query_length) once per result set
+    current_match_changed = Signal(int) # Emits the index of the match navigated to
     
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -2010,9 +2666,11 @@ class SearchTab(QWidget):
             self.current_match_index = -1
             self.prev_match_button.setEnabled(False)
             self.next_match_button.setEnabled(False)
-            self.highlight_requested.emit([], -1, 0) # Clear highlights in TextTab
+            self.matches_changed.emit([], 0) # Clear highlights in TextTab
             return
 
+        self.matches_changed.emit(self.search_matches, query_length)
+
         # Populate results list with snippets
         for i, (start_pos, line_num) in enumerate(self.search_matches):
             # Get the line containing the match
@@ -2050,7 +2708,7 @@ class SearchTab(QWidget):
         self.results_list_widget.clear()
         self.prev_match_button.setEnabled(False)
         self.next_match_button.setEnabled(False)
-        self.highlight_requested.emit([], -1, 0) # Clear highlights in TextTab
+        self.matches_changed.emit([], 0) # Clear highlights in TextTab
 
     def _update_match_navigation_buttons(self):
         if len(self.search_matches) > 1:
@@ -2082,13 +2740,343 @@ class SearchTab(QWidget):
         self._highlight_current_match_in_text_tab()
 
     def _highlight_current_match_in_text_tab(self):
+        # The matches themselves were sent once with matches_changed; only the index travels per step
         if self.search_matches and self.current_match_index != -1:
-            self.highlight_requested.emit(self.search_matches, self.current_match_index, self.current_query_length)
+            self.current_match_changed.emit(self.current_match_index)
+
+
+# --- Analysis Export ---
+
+def _report_tr(text):
+    """Translates report text in the main window's context; safe to call from worker threads."""
+    return QCoreApplication.translate("InfoscavaMainWindow", text)
+
+def _write_txt_report(f, metadata, previews):
+    """Writes the plain-text analysis report to the open text file f."""
+    f.write(_report_tr("--- Infoscava Analysis Report ---\n\n"))
+    for label, value, _ in previews['rendered_metadata']:
+        if isinstance(value, dict):
+            # Stream dict values straight into the file instead of building the pretty-printed string first
+            f.write(f"{label}:\n")
+            json.dump(value, f, indent=2, ensure_ascii=False)
+            f.write("\n")
         else:
-            self.highlight_requested.emit([], -1, 0) # Clear highlights
+            f.write(f"{label}: {value}\n")
+
+    if metadata.get('plugin_analysis_results'):
+        f.write("\n--- Plugin Analysis Results ---\n\n")
+        for plugin_name, plugin_output in metadata['plugin_analysis_results'].items():
+            f.write(f"Plugin: {plugin_name}\n")
+            if isinstance(plugin_output, dict) and plugin_output.get("infoscava_output_type") == "html":
+                f.write(f"  Output Type: HTML (content truncated for text export)\n")
+                # For text export, just show a snippet or indicator for HTML
+                f.write(f"  Content: {plugin_output.get('content', '')[:500]}...\n\n")
+            elif isinstance(plugin_output, dict):
+                f.write("  Content:\n")
+                json.dump(plugin_output, f, indent=2, ensure_ascii=False)
+                f.write("\n\n")
+            else:
+                f.write(f"  Content:\n{str(plugin_output)}\n\n")
+
+    f.write("\n--- Text Content (Preview) ---\n\n")
+    f.write(previews['text'])
+
+def _write_html_report(f, metadata, previews):
+    """Writes the HTML analysis report to the open text file f, piece by piece."""
+    write = f.write
+    write(_HTML_REPORT_HEAD_TMPL.format_map({
+        'title': _report_tr("Infoscava Analysis Report"),
+        'style': _HTML_REPORT_STYLE,
+        'metadata_heading': _report_tr("File Metadata"),
+    }))
+    for label, value, html_value in previews['rendered_metadata']:
+        if html_value is None: # Dict values are only pretty-printed when actually exported
+            html_value = "<pre>" + html.escape(json.dumps(value, indent=2, ensure_ascii=False), quote=True) + "</pre>"
+        write(_HTML_ROW_TMPL.format(label, html_value))
+    write(_HTML_METADATA_TAIL)
+
+    # Add Plugin Analysis Results
+    if metadata.get('plugin_analysis_results'):
+        write(f"""
+        <div class="section">
+            <h2>{_report_tr("Plugin Analysis Results")}</h2>
+        """)
+        for plugin_name, plugin_output in metadata['plugin_analysis_results'].items():
+            write(f"<h3>{_report_tr('Plugin')}: {html.escape(plugin_name)}</h3>")
+            if isinstance(plugin_output, dict) and plugin_output.get("infoscava_output_type") == "html":
+                write(plugin_output.get("content", "<p>No HTML content provided.</p>")) # Plugin HTML is embedded as-is
+            elif isinstance(plugin_output, dict):
+                write(f"<pre>{html.escape(json.dumps(plugin_output, indent=2, ensure_ascii=False))}</pre>")
+            else:
+                write(f"<pre>{html.escape(str(plugin_output))}</pre>")
+        write("</div>")
+
+    # The previews are file content, so escape them; a '<' in the file must not become markup
+    for key, heading in (('text', "Text Content (Preview)"), ('hex', "Hexadecimal View (Preview)"),
+                         ('structured', "Structured View (Preview)"), ('base64', "Base64 Encoded Content")):
+        if previews.get(key):
+            write(_HTML_SECTION_TMPL.format(_report_tr(heading), html.escape(previews[key])))
+
+    write(_HTML_REPORT_TAIL)
+
+def _orjson_report(metadata):
+    """Serializes the JSON report with orjson, or returns None if it holds values orjson rejects."""
+    try:
+        return orjson.dumps(metadata, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    except orjson.JSONEncodeError: # e.g. integers beyond 64 bits or lone surrogates; json.dump copes with those
+        return None
+
+def _write_report(f, kind, metadata, previews):
+    """
+    Writes the report of the given kind ('json', 'txt' or 'html') to the open text file f.
+    Only works on plain Python snapshots, so it is safe to run outside the GUI thread.
+    """
+    if kind == 'json':
+        json.dump(metadata, f, indent=2, ensure_ascii=False) # Same layout as _orjson_report
+    elif kind == 'txt':
+        _write_txt_report(f, metadata, previews)
+    else:
+        _write_html_report(f, metadata, previews)
+
+class ExportWorkerSignals(QObject):
+    """Defines the signals available from a running export worker."""
+    finished = Signal(str) # Emits the exported filename
+    error = Signal(str)    # Emits error message string
+
+class ExportWorker(QRunnable):
+    """
+    A QRunnable that builds an analysis report and writes it to disk off the GUI thread.
+    Emits signals for completion and errors.
+    """
+    def __init__(self, filename, kind, metadata, previews):
+        super().__init__()
+        self.filename = filename
+        self.kind = kind
+        self.metadata = metadata
+        self.previews = previews
+        self.signals = ExportWorkerSignals()
+
+    def run(self):
+        """Builds the report and writes it to the target file."""
+        try:
+            report = _orjson_report(self.metadata) if self.kind == 'json' and ORJSON_AVAILABLE else None
+            if report is not None:
+                with open(self.filename, 'wb') as f: # orjson already produced UTF-8 bytes
+                    f.write(report)
+            else:
+                with open(self.filename, 'w', encoding='utf-8', buffering=1 << 20) as f: # Coalesces the many small writes
+                    _write_report(f, self.kind, self.metadata, self.previews)
+            self.signals.finished.emit(self.filename)
+        except Exception as e:
+            self.signals.error.emit(str(e))
+
+
+# --- Themes ---
+
+# Palette colours of the two themes as (role, colour) pairs, with the QColors built once at import from integer RGB
+_DARK_PALETTE_ROLES = (
+    (QPalette.Window, QColor(0x1e, 0x1e, 0x1e)),
+    (QPalette.WindowText, QColor(0xff, 0xff, 0xff)),
+    (QPalette.Base, QColor(0x2d, 0x2d, 0x30)),
+    (QPalette.AlternateBase, QColor(0x3c, 0x3c, 0x3c)),
+    (QPalette.ToolTipBase, QColor(0x2d, 0x2d, 0x30)),
+    (QPalette.ToolTipText, QColor(0xff, 0xff, 0xff)),
+    (QPalette.Text, QColor(0xff, 0xff, 0xff)),
+    (QPalette.Button, QColor(0x33, 0x33, 0x33)),
+    (QPalette.ButtonText, QColor(0xff, 0xff, 0xff)),
+    (QPalette.BrightText, QColor(0xff, 0x00, 0x00)),
+    (QPalette.Link, QColor(0x61, 0xaf, 0xef)),
+    (QPalette.Highlight, QColor(0x00, 0x7a, 0xcc)),
+    (QPalette.HighlightedText, QColor(0xff, 0xff, 0xff)),
+)
+
+# Refined light theme colors for a production-level look
+_LIGHT_PALETTE_ROLES = (
+    (QPalette.Window, QColor(0xf8, 0xf8, 0xf8)), # Main window background - soft white
+    (QPalette.WindowText, QColor(0x1e, 0x1e, 0x1e)), # Dark text for readability
+    (QPalette.Base, QColor(0xff, 0xff, 0xff)), # Base for input fields, text areas - pure white for content
+    (QPalette.AlternateBase, QColor(0xf0, 0xf0, 0xf0)), # Alternate row colors in lists/tables
+    (QPalette.ToolTipBase, QColor(0xff, 0xff, 0xff)),
+    (QPalette.ToolTipText, QColor(0x1e, 0x1e, 0x1e)),
+    (QPalette.Text, QColor(0x1e, 0x1e, 0x1e)),
+    (QPalette.Button, QColor(0xe8, 0xe8, 0xe8)), # Light gray button background
+    (QPalette.ButtonText, QColor(0x1e, 0x1e, 0x1e)),
+    (QPalette.BrightText, QColor(0xff, 0x00, 0x00)), # Standard bright text color
+    (QPalette.Link, QColor(0x00, 0x7b, 0xff)), # Standard blue for links
+    (QPalette.Highlight, QColor(0xaa, 0xdd, 0xff)), # Light blue for selection highlight
+    (QPalette.HighlightedText, QColor(0x1e, 0x1e, 0x1e)), # Dark text on highlight
+)
+
+def _minify_qss(qss):
+    """Strips comments and collapses whitespace in a stylesheet so Qt's CSS parser has less to tokenize."""
+    return re.sub(r'\s+', ' ', re.sub(r'/\*.*?\*/', '', qss, flags=re.S)).strip()
+
+# Application stylesheets of the two themes, built (and minified) once instead of on every switch
+_DARK_QSS = _minify_qss("""
+    /* Reset QTreeView::branch styling to allow native indicators */
+    QTreeView::branch {
+        border: none;
+        background: transparent;
+        padding: 0;
+        margin: 0;
+        width: 16px; /* Explicit width to ensure space for indicator */
+        height: 16px; /* Explicit height to ensure space for indicator */
+    }
+    /* General QTreeView styling for visibility */
+    QTreeView {
+        background-color: #2d2d30; /* Dark background */
+        color: #ffffff; /* White text */
+        alternate-background-color: #3c3c3c;
+        border: 1px solid #555555;
+    }
+    QTreeView::item {
+        color: #ffffff;
+    }
+    QTreeView::item:selected {
+        background-color: #007acc;
+        color: #ffffff;
+    }
+""")
+
+_LIGHT_QSS = _minify_qss("""
+    QMainWindow, QWidget, QSplitter {
+        background-color: #f8f8f8; /* Soft white for main window background */
+        color: #1e1e1e; /* Dark text */
+    }
+    QMenuBar {
+        background-color: #e8e8e8; /* Slightly darker than main window for distinction */
+        color: #1e1e1e;
+        border-bottom: 1px solid #d8d8d8; /* Subtle border */
+    }
+    QMenuBar::item {
+        background-color: transparent;
+        color: #1e1e1e;
+        padding: 5px 10px;
+    }
+    QMenuBar::item:selected {
+        background-color: #d0d0d0; /* Highlight on hover */
+    }
+    QMenu {
+        background-color: #ffffff; /* Pure white for dropdown menus */
+        color: #1e1e1e;
+        border: 1px solid #d8d8d8;
+        border-radius: 4px;
+    }
+    QMenu::item {
+        padding: 6px 20px 6px 10px; /* Padding for menu items */
+    }
+    QMenu::item:selected {
+        background-color: #aaddff;
+        color: #1e1e1e;
+    }
+    QTextEdit, QPlainTextEdit, QTextBrowser {
+        background-color: #ffffff; /* Pure white for text content areas */
+        color: #1e1e1e;
+        border: 1px solid #d8d8d8;
+        border-radius: 4px;
+        padding: 5px;
+    }
+    QComboBox {
+        background-color: #ffffff;
+        color: #1e1e1e;
+        border: 1px solid #d8d8d8;
+        border-radius: 4px;
+        padding: 2px 5px;
+        selection-background-color: #aaddff;
+        selection-color: #1e1e1e;
+    }
+    QLineEdit {
+        background-color: #ffffff;
+        color: #1e1e1e;
+        border: 1px solid #d8d8d8;
+        border-radius: 4px;
+        padding: 2px 5px;
+    }
+    QLabel {
+        color: #1e1e1e;
+    }
+    QPushButton {
+        background-color: #e8e8e8;
+        color: #1e1e1e;
+        border: 1px solid #c8c8c8; /* Slightly darker border for buttons */
+        border-radius: 4px;
+        padding: 6px 12px;
+        font-weight: 500;
+    }
+    QPushButton:hover {
+        background-color: #d8d8d8;
+        border-color: #b8b8b8;
+    }
+    QPushButton:pressed {
+        background-color: #c8c8c8;
+        border-color: #a8a8a8;
+    }
+    QTreeView {
+        background-color: #f5f5f5; /* Very subtle darker white for QTreeView background */
+        color: #1e1e1e;
+        alternate-background-color: #f0f0f0; /* Clearer alternate row color */
+        border: 1px solid #d8d8d8;
+        border-radius: 4px;
+    }
+    QTreeView::item {
+        color: #1e1e1e;
+        padding: 3px 0; /* Add some vertical padding to items */
+    }
+    QTreeView::item:selected {
+        background-color: #aaddff;
+        color: #1e1e1e;
+    }
+    QTreeView::branch:selected {
+        background-color: #aaddff; /* Ensure branches also highlight correctly */
+    }
+    /* Removed specific QTreeView::branch styling to allow native indicators */
+    QStatusBar {
+        background-color: #e8e8e8;
+        color: #1e1e1e;
+        border-top: 1px solid #d8d8d8;
+    }
+    QProgressBar {
+        background-color: #e0e0e0;
+        color: #1e1e1e;
+        border: 1px solid #c0c0c0;
+        border-radius: 5px;
+        text-align: center;
+    }
+    QProgressBar::chunk {
+        background-color: #007bff;
+        border-radius: 5px;
+    }
+    QTabWidget::pane { /* The content area below the tabs */
+        border: 1px solid #d8d8d8;
+        background-color: #f8f8f8; /* Matches main window background */
+        border-radius: 4px;
+        margin-top: -1px; /* Overlap with tab bar border */
+    }
+    QTabBar::tab {
+        background: #e5e5e5; /* Light grey for inactive tabs */
+        border: 1px solid #d8d8d8;
+        border-bottom-color: #d8d8d8; /* Same as pane border */
+        border-top-left-radius: 4px;
+        border-top-right-radius: 4px;
+        padding: 8px 15px;
+        margin-right: 2px;
+        color: #1e1e1e;
+    }
+    QTabBar::tab:selected {
+        background: #f8f8f8; /* Matches main window background */
+        border-bottom-color: #f8f8f8; /* Make selected tab's bottom border blend with pane */
+        font-weight: bold;
+    }
+    QTabBar::tab:hover:!selected {
+        background: #d8d8d8; /* Slightly darker grey on hover for inactive tabs */
+    }
+""")
 
 
 class InfoscavaMainWindow(QMainWindow):
+    _dark_palette = None # Theme palettes, built on first use and shared by every later switch
+    _light_palette = None
+
     def __init__(self, initial_filepath=None):
         super().__init__()
         self.setWindowTitle(self.tr("Infoscava - Universal File Analyzer"))
@@ -2098,9 +3086,38 @@ class InfoscavaMainWindow(QMainWindow):
         self.current_filepath = None
         self.file_content_bytes = b""
         self.file_metadata = {}
+        self._content_cache_key = None # (path, mtime_ns, size) of the bytes in file_content_bytes
+        self._content_stale = False # Set by the file watcher when the loaded file changes on disk
+        self._last_plugin_history_limit = None # MAX_PLUGIN_HISTORY_ENTRIES last pushed to the plugin manager
+        self._last_preview_settings = None # Preview limits the tabs were last rendered with by _update_ui_with_settings
+        self._has_content = False # Whether any tab currently shows file content that a clear would have to reset
+        self._dirty_tabs = set() # Preview tabs whose content is rendered the next time they are shown
+        self._pending_preview = (b"", False, None) # (preview_bytes, is_large_file, cache_key) the dirty tabs are rendered from
+        self._decoded_preview = None # (key, text) of the last large-file preview decoded for the text/structured tabs
+        self._file_read_generation = 0 # Bumped by every load or re-read so stale background reads are dropped
+        self._rendered_metadata_cache = None # (label, value, html) rows shared by the TXT and HTML exporters
+        self._histogram_digest = None # (size, SHA-256) of the content currently shown in the entropy/histogram tabs
+        self._last_analysis_plugin_signature = None # Analysis plugins that produced the current results
+        self._current_theme = None # 'dark' or 'light' once a theme has been applied
+        self._pending_theme = None # Theme preference waiting to be written by the debounce timer
+        self._saved_theme = None # Theme preference as last read from or written to disk
+        self._about_html = None # Translated About text, built on first use and reset when the language changes
+        self._theme_save_timer = QTimer(self)
+        self._theme_save_timer.setSingleShot(True)
+        self._theme_save_timer.setInterval(500)
+        self._theme_save_timer.timeout.connect(self._flush_theme_preference)
         self.analysis_thread = None # Keep a reference to the thread
+        self.thread_pool = QThreadPool(self) # Background jobs owned by the window (e.g. exports)
+        self._export_worker = None # Keep a reference to the running export
         self.file_watcher = QFileSystemWatcher(self)
         self.file_watcher.fileChanged.connect(self._on_file_changed)
+        self._watched_path = None # Path currently registered with file_watcher
+        # Editors emit several change notifications per save (write, rename, chmod); reload once they settle
+        self._changed_path = None
+        self._file_change_timer = QTimer(self)
+        self._file_change_timer.setSingleShot(True)
+        self._file_change_timer.setInterval(200)
+        self._file_change_timer.timeout.connect(self._on_file_change_settled)
 
         # Initialize SettingsManager and load settings
         self.settings_manager = SettingsManager(self)
@@ -2121,7 +3138,8 @@ class InfoscavaMainWindow(QMainWindow):
         # Connect TextTab content changes to SearchTab
         self.text_tab.text_content_changed.connect(self.search_tab.set_text_content)
         # Connect SearchTab highlight requests to TextTab
-        self.search_tab.highlight_requested.connect(self.text_tab.highlight_matches)
+        self.search_tab.matches_changed.connect(self.text_tab.set_match_highlights)
+        self.search_tab.current_match_changed.connect(self.text_tab.set_current_match)
 
         self._setup_menu_bar()
         self._setup_status_bar()
@@ -2220,6 +3238,8 @@ class InfoscavaMainWindow(QMainWindow):
         self.analysis_plugin_tabs = {} # To keep track of dynamically added plugin tabs (per file analysis)
         self.static_plugin_tabs = {} # To keep track of static HTML plugin tabs (loaded at startup)
 
+        self.tab_widget.currentChanged.connect(self._on_current_tab_changed)
+
         self.splitter.addWidget(self.content_widget)
 
     def _setup_menu_bar(self):
@@ -2308,17 +3328,17 @@ class InfoscavaMainWindow(QMainWindow):
 
     def _load_file(self, filepath):
         if not os.path.exists(filepath):
-            QMessageBox.warning(self, self.tr("File Not Found"), self.tr(f"The file '{filepath}' does not exist."))
+            QMessageBox.warning(self, self.tr("File Not Found"), self.tr("The file '{0}' does not exist.").format(filepath))
             return
         if not os.access(filepath, os.R_OK):
-            QMessageBox.warning(self, self.tr("Permission Denied"), self.tr(f"Cannot read file '{filepath}'. Permission denied."))
+            QMessageBox.warning(self, self.tr("Permission Denied"), self.tr("Cannot read file '{0}'. Permission denied.").format(filepath))
             return
         # Security check: Prevent loading files from sensitive system directories
         if sys.platform.startswith('linux') or sys.platform.startswith('darwin'): # Linux/macOS
             sensitive_paths = ['/proc', '/dev', '/sys']
             for sensitive_path in sensitive_paths:
                 if os.path.commonpath([filepath, sensitive_path]) == sensitive_path:
-                    QMessageBox.warning(self, self.tr("Invalid File Path"), self.tr(f"Loading files from '{filepath}' is not allowed for security reasons."))
+                    QMessageBox.warning(self, self.tr("Invalid File Path"), self.tr("Loading files from '{0}' is not allowed for security reasons.").format(filepath))
                     return
         elif sys.platform.startswith('win'): # Windows
             sensitive_paths = [
@@ -2334,25 +3354,34 @@ class InfoscavaMainWindow(QMainWindow):
             for sensitive_path in sensitive_paths:
                 sensitive_path_norm = os.path.normpath(sensitive_path).lower()
                 if filepath_norm.startswith(sensitive_path_norm):
-                    QMessageBox.warning(self, self.tr("Invalid File Path"), self.tr(f"Loading files from '{filepath}' is not allowed for security reasons."))
+                    QMessageBox.warning(self, self.tr("Invalid File Path"), self.tr("Loading files from '{0}' is not allowed for security reasons.").format(filepath))
                     return
 
         self.current_filepath = filepath
+        self._rendered_metadata_cache = None
+        self._file_read_generation += 1
+        self._last_analysis_plugin_signature = None # Recorded again once the analysis has run the plugins
         self.file_path_display.setText(filepath)
-        self.status_bar.showMessage(self.tr(f"Loading file: {os.path.basename(filepath)}..."))
+        self.status_bar.showMessage(self.tr("Loading file: {0}...").format(os.path.basename(filepath)))
         self.progress_bar.setValue(0) # Ensure progress bar starts at 0
         self.progress_bar.show()
 
         try:
+            self.file_content_bytes = b"" # Drop the previous file before reading the next
             with open(filepath, 'rb') as f:
+                st = os.fstat(f.fileno())
+                # The whole file, even when it is only previewed: Base64, the histogram, plugins and the
+                # structured JSON view all need all of it, and the tabs slice out the window they show
                 self.file_content_bytes = f.read()
+            self._content_cache_key = (filepath, st.st_mtime_ns, st.st_size)
+            self._content_stale = False
             self._start_analysis_thread(filepath) # Changed to start analysis thread
             self._start_file_watcher(filepath)
         except MemoryError:
             QMessageBox.critical(self, self.tr("Memory Error"), self.tr("File is too large to load into memory."))
             self._clear_all()
         except Exception as e:
-            QMessageBox.critical(self, self.tr("File Load Error"), self.tr(f"An error occurred while loading the file: {e}"))
+            QMessageBox.critical(self, self.tr("File Load Error"), self.tr("An error occurred while loading the file: {0}").format(e))
             self._clear_all()
 
     def _start_analysis_thread(self, filepath):
@@ -2361,8 +3390,9 @@ class InfoscavaMainWindow(QMainWindow):
             self.analysis_thread.quit()
             self.analysis_thread.wait()
 
-        # Pass the current MAX_FILE_SIZE_FOR_FULL_READ from settings
-        self.analysis_thread = FileAnalyzerThread(filepath, self.app_settings['MAX_FILE_SIZE_FOR_FULL_READ'], self)
+        # Pass the current MAX_FILE_SIZE_FOR_FULL_READ and MD5 settings
+        self.analysis_thread = FileAnalyzerThread(filepath, self.app_settings['MAX_FILE_SIZE_FOR_FULL_READ'],
+                                                  self.app_settings['COMPUTE_MD5'], self.app_settings['MAX_FILE_SIZE_FOR_MD5'], self)
         self.analysis_thread.finished.connect(self._on_analysis_finished)
         self.analysis_thread.error.connect(self._on_analysis_error)
         self.analysis_thread.progress.connect(self._on_analysis_progress)
@@ -2373,21 +3403,33 @@ class InfoscavaMainWindow(QMainWindow):
         self.status_bar.showMessage(message)
 
     def _on_analysis_finished(self, results):
+        # The analysis counted every byte for the entropy (or has the counts cached); reuse them for the histogram
+        byte_histogram = results.pop('byte_histogram', None)
+        image_preview = results.pop('image_preview', None)
         self.file_metadata = results
         self.metadata_tab.update_metadata(results)
 
         is_large_file = results.get('size', 0) > self.app_settings['MAX_FILE_SIZE_FOR_FULL_READ']
 
+        self._dirty_tabs.clear() # All previews are rendered from the fresh results below
+        self._has_content = True
         self.text_tab.set_file_content(self.file_content_bytes, results.get('encoding'), is_large_file, self.app_settings['MAX_TEXT_PREVIEW_LINES'])
-        self.hex_tab.set_file_content(self.file_content_bytes, is_large_file, self.app_settings['MAX_HEX_PREVIEW_BYTES'])
+        max_hex = self.app_settings['MAX_HEX_PREVIEW_BYTES']
+        # The hex tab only ever shows the first max_hex bytes of a large file, so only hand it that window
+        self.hex_tab.set_file_content(self.file_content_bytes[:max_hex] if is_large_file else self.file_content_bytes, is_large_file, max_hex)
         self.structured_tab.set_file_content(self.file_content_bytes, results.get('mime_type'), results.get('encoding'), is_large_file, self.app_settings['MAX_STRUCTURED_PREVIEW_LINES'])
         self.base64_tab.set_file_content(self.file_content_bytes)
-        self.entropy_tab.update_entropy(results.get('entropy'))
-        self.byte_histogram_tab.plot_histogram(self.file_content_bytes)
+        # Reloads of unchanged content (watcher events, plugin changes) would redraw an identical histogram;
+        # the analysis already hashed the content, so its SHA-256 identifies it without another pass
+        content_digest = (results.get('size'), results.get('sha256_hash')) if isinstance(results.get('entropy'), float) else None
+        if content_digest is None or content_digest != self._histogram_digest:
+            self.entropy_tab.update_entropy(results.get('entropy'))
+            self.byte_histogram_tab.plot_histogram(self.file_content_bytes, byte_histogram)
+            self._histogram_digest = content_digest
 
         if PIL_AVAILABLE and results.get('mime_type', '').startswith('image/'):
             self.tab_widget.setTabEnabled(self.tab_widget.indexOf(self.image_metadata_tab), True)
-            self.image_metadata_tab.update_image_data(self.current_filepath, results)
+            self.image_metadata_tab.update_image_data(self.current_filepath, results, image_preview)
         else:
             self.tab_widget.setTabEnabled(self.tab_widget.indexOf(self.image_metadata_tab), False)
 
@@ -2397,6 +3439,7 @@ class InfoscavaMainWindow(QMainWindow):
         # Store plugin results in self.file_metadata for export
         self.file_metadata['plugin_analysis_results'] = {} 
         plugin_raw_results = self.plugin_manager.execute_analysis_plugins(self.current_filepath, self.file_content_bytes)
+        self._last_analysis_plugin_signature = self._analysis_plugin_signature()
         
         for plugin_name, result in plugin_raw_results.items():
             self.file_metadata['plugin_analysis_results'][plugin_name] = result # Store raw result for export
@@ -2457,7 +3500,10 @@ class InfoscavaMainWindow(QMainWindow):
     def _clear_all(self):
         self.current_filepath = None
         self.file_content_bytes = b""
+        self._content_cache_key = None
+        self._file_read_generation += 1
         self.file_metadata = {}
+        self._rendered_metadata_cache = None
         self.file_path_display.setText(self.tr("No file selected."))
         self.status_bar.showMessage(self.tr("Ready."))
         self.progress_bar.hide()
@@ -2465,20 +3511,31 @@ class InfoscavaMainWindow(QMainWindow):
         self._clear_all_tabs_content()
         self._clear_analysis_plugin_tabs() # Clear all dynamic analysis plugin tabs
         # For now, keeping static tabs persistent, as they are loaded once at startup.
-        if self.file_watcher.files():
-            self.file_watcher.removePaths(self.file_watcher.files())
+        self._stop_file_watcher()
 
     def _clear_all_tabs_content(self):
-        self.metadata_tab.update_metadata({})
-        self.text_tab.set_file_content(b"", max_text_preview_lines=self.app_settings['MAX_TEXT_PREVIEW_LINES'])
-        self.search_tab.set_text_content("") # Clear search tab content
-        self.hex_tab.set_file_content(b"", max_hex_preview_bytes=self.app_settings['MAX_HEX_PREVIEW_BYTES'])
-        self.structured_tab.set_file_content(b"", "", max_structured_preview_lines=self.app_settings['MAX_STRUCTURED_PREVIEW_LINES'])
-        self.image_metadata_tab.update_image_data("", {})
-        self.base64_tab.set_file_content(b"")
-        self.entropy_tab.update_entropy("N/A")
-        self.byte_histogram_tab.plot_histogram(b"")
-        self.tab_widget.setTabEnabled(self.tab_widget.indexOf(self.image_metadata_tab), False)
+        # Suspend painting so the tabs are reset in a single layout/paint pass instead of one per widget
+        self.tab_widget.setUpdatesEnabled(False)
+        # The search tab is cleared explicitly below, so don't let the text tab cascade its own reset into it
+        text_tab_blocker = QSignalBlocker(self.text_tab)
+        try:
+            self._dirty_tabs.clear()
+            self._has_content = False
+            self.metadata_tab.update_metadata({})
+            self.text_tab.set_file_content(b"", max_text_preview_lines=self.app_settings['MAX_TEXT_PREVIEW_LINES'])
+            self.search_tab.set_text_content("") # Clear search tab content
+            self.hex_tab.set_file_content(b"", max_hex_preview_bytes=self.app_settings['MAX_HEX_PREVIEW_BYTES'])
+            self.structured_tab.set_file_content(b"", "", max_structured_preview_lines=self.app_settings['MAX_STRUCTURED_PREVIEW_LINES'])
+            self.image_metadata_tab.update_image_data("", {})
+            self.base64_tab.set_file_content(b"")
+            self.entropy_tab.update_entropy("N/A")
+            self.byte_histogram_tab.plot_histogram(b"")
+            self._histogram_digest = None
+            self.tab_widget.setTabEnabled(self.tab_widget.indexOf(self.image_metadata_tab), False)
+        finally:
+            text_tab_blocker.unblock()
+            self.tab_widget.setUpdatesEnabled(True)
+            self.tab_widget.update()
 
     def _clear_analysis_plugin_tabs(self):
         """Removes all dynamically added analysis plugin tabs."""
@@ -2505,16 +3562,12 @@ class InfoscavaMainWindow(QMainWindow):
             return
 
         # Check static plugin tabs
-        for name, widget in list(self.static_plugin_tabs.items()):
-            if name == plugin_name:
-                index = self.tab_widget.indexOf(widget)
-                if index != -1:
-                    widget_to_remove = self.tab_widget.widget(index)
-                    if widget_to_remove: # Add check for None
-                        self.tab_widget.removeTab(index)
-                        widget_to_remove.deleteLater()
-                    del self.static_plugin_tabs[name]
-                    return
+        widget = self.static_plugin_tabs.pop(plugin_name, None)
+        if widget is not None:
+            index = self.tab_widget.indexOf(widget)
+            if index != -1:
+                self.tab_widget.removeTab(index)
+            widget.deleteLater()
 
     @Slot(str)
     def _add_static_plugin_tab_if_applicable(self, plugin_name):
@@ -2554,20 +3607,45 @@ class InfoscavaMainWindow(QMainWindow):
             self._load_file(filepath)
 
     def _start_file_watcher(self, filepath):
-        if self.file_watcher.files():
-            self.file_watcher.removePaths(self.file_watcher.files())
-        self.file_watcher.addPath(filepath)
+        # Reloading the same file keeps its existing watch instead of removing and re-adding it.
+        # Editors that replace the file on save drop the watch, so re-add it in that case.
+        if filepath == self._watched_path and filepath in self.file_watcher.files():
+            return
+        try:
+            self._stop_file_watcher()
+            if self.file_watcher.addPath(filepath):
+                self._watched_path = filepath
+            else:
+                # e.g. the inotify watch limit (/proc/sys/fs/inotify/max_user_watches) is exhausted
+                self.status_bar.showMessage(self.tr("Could not watch file for changes. Automatic reload is disabled."), 5000)
+        except Exception as e:
+            self._watched_path = None
+            self.status_bar.showMessage(self.tr("Could not watch file for changes: {0}").format(e), 5000)
+
+    def _stop_file_watcher(self):
+        if self._watched_path and self._watched_path in self.file_watcher.files():
+            self.file_watcher.removePath(self._watched_path)
+        self._watched_path = None
 
     def _on_file_changed(self, path):
         if path == self.current_filepath:
-            # Check if the file still exists
-            if os.path.exists(path):
-                QMessageBox.information(self, self.tr("File Changed"), self.tr("The loaded file has changed on disk. Reloading..."))
-                self._load_file(self.current_filepath)
-            else:
-                # File was deleted
-                QMessageBox.information(self, self.tr("File Deleted"), self.tr("The loaded file has been deleted from disk. Clearing analysis."))
-                self._clear_all() # Perform a full cleanup
+            self._content_stale = True # The bytes in memory no longer match the disk until reloaded
+            self._changed_path = path
+            self._file_change_timer.start() # Restarted by every further notification
+
+    def _on_file_change_settled(self):
+        """Reloads (or clears) the current file once its change notifications have stopped for a moment."""
+        if self._changed_path is None or self._changed_path != self.current_filepath:
+            return # Another file was loaded meanwhile
+        self._changed_path = None
+        # Check if the file still exists (editors that replace the file on save have recreated it by now)
+        if os.path.exists(self.current_filepath):
+            self._load_file(self.current_filepath) # Re-adds the watch if the save replaced the file
+            self.status_bar.showMessage(self.tr("The loaded file has changed on disk. Reloading..."))
+        else:
+            # File was deleted
+            QMessageBox.information(self, self.tr("File Deleted"), self.tr("The loaded file has been deleted from disk. Clearing analysis."))
+            self._clear_all() # Perform a full cleanup
 
     @Slot()
     def _reanalyze_current_file_if_loaded(self):
@@ -2576,10 +3654,22 @@ class InfoscavaMainWindow(QMainWindow):
         Called when plugin configuration changes (load, delete, reload).
         """
         if self.current_filepath and os.path.exists(self.current_filepath):
+            # Static plugin tabs are handled by their own load/delete slots; only changes to the
+            # analysis plugins that produced the current results are worth a full re-analysis
+            if self._analysis_plugin_signature() == self._last_analysis_plugin_signature:
+                return
             self._load_file(self.current_filepath) # Re-load and re-analyze
         else:
             self._clear_all() # Just clear the UI if no file to re-analyze
 
+    def _analysis_plugin_signature(self):
+        """Returns a hashable snapshot of the loaded analysis plugins and their file modification times."""
+        return tuple(sorted(
+            (name, info.get('mtime'))
+            for name, info in self.plugin_manager.loaded_plugins.items()
+            if info['type'] == 'analysis_plugin'
+        ))
+
 
     def _reload_current_file(self):
         if self.current_filepath:
@@ -2591,443 +3681,226 @@ class InfoscavaMainWindow(QMainWindow):
         if not self.file_metadata:
             QMessageBox.warning(self, self.tr("No Analysis to Export"), self.tr("Please load and analyze a file first."))
             return
+        if self._export_worker is not None:
+            QMessageBox.information(self, self.tr("Export In Progress"), self.tr("Please wait for the current export to finish."))
+            return
 
         filename, _ = QFileDialog.getSaveFileName(self, self.tr("Export Analysis"), os.path.basename(self.current_filepath or "report"),
                                                   self.tr("JSON Files (*.json);;Text Files (*.txt);;HTML Files (*.html)"))
         if not filename:
             return
 
-        try:
-            if filename.endswith('.json'):
-                with open(filename, 'w', encoding='utf-8') as f:
-                    json.dump(self.file_metadata, f, indent=4, ensure_ascii=False)
-            elif filename.endswith('.txt'):
-                with open(filename, 'w', encoding='utf-8') as f:
-                    f.write(self.tr("--- Infoscava Analysis Report ---\n\n"))
-                    for key, value in self.file_metadata.items():
-                        # Skip plugin_analysis_results for top-level display, handle separately
-                        if key == 'plugin_analysis_results':
-                            continue
-                        display_value = value
-                        if isinstance(value, dict):
-                            display_value = json.dumps(value, indent=2, ensure_ascii=False)
-                        elif isinstance(value, float):
-                            if key == 'encoding_confidence':
-                                display_value = f"{value:.2f}%"
-                            else:
-                                display_value = f"{value:.4f}"
-                        elif key == 'size':
-                            display_value = human_readable_size(value)
-                        f.write(f"{key.replace('_', ' ').title()}: {display_value}\n")
-
-                    if 'plugin_analysis_results' in self.file_metadata and self.file_metadata['plugin_analysis_results']:
-                        f.write("\n--- Plugin Analysis Results ---\n\n")
-                        for plugin_name, plugin_output in self.file_metadata['plugin_analysis_results'].items():
-                            f.write(f"Plugin: {plugin_name}\n")
-                            if isinstance(plugin_output, dict) and plugin_output.get("infoscava_output_type") == "html":
-                                f.write(f"  Output Type: HTML (content truncated for text export)\n")
-                                # For text export, just show a snippet or indicator for HTML
-                                f.write(f"  Content: {plugin_output.get('content', '')[:500]}...\n\n")
-                            elif isinstance(plugin_output, dict):
-                                f.write(f"  Content:\n{json.dumps(plugin_output, indent=2, ensure_ascii=False)}\n\n")
-                            else:
-                                f.write(f"  Content:\n{str(plugin_output)}\n\n")
-
-                    f.write("\n--- Text Content (Preview) ---\n\n")
-                    f.write(self.text_tab.text_editor.toPlainText()[:self.app_settings['MAX_TEXT_PREVIEW_LINES'] * 2])
-            elif filename.endswith('.html'):
-                html_content = self._generate_html_report()
-                with open(filename, 'w', encoding='utf-8') as f:
-                    f.write(html_content)
-            self.status_bar.showMessage(self.tr(f"Analysis exported to {filename}"), 5000)
-        except Exception as e:
-            QMessageBox.critical(self, self.tr("Export Error"), self.tr(f"Failed to export analysis: {e}"))
-
-    def _generate_html_report(self):
-        report_html = f"""
-        <!DOCTYPE html>
-        <html lang="en">
-        <head>
-            <meta charset="UTF-8">
-            <meta name="viewport" content="width=device-width, initial-scale=1.0">
-            <title>{self.tr("Infoscava Analysis Report")}</title>
-            <style>
-                body {{ font-family: Arial, sans-serif; margin: 20px; background-color: #f4f4f4; color: #333; }}
-                h1 {{ color: #0056b3; }}
-                h2 {{ color: #007bff; border-bottom: 1px solid #ccc; padding-bottom: 5px; margin-top: 20px; }}
-                .section {{ background-color: #fff; border-radius: 8px; padding: 15px; margin-bottom: 15px; box-shadow: 0 2px 4px rgba(0,0,0,0.1); }}
-                .label {{ font-weight: bold; margin-right: 5px; color: #555; }}
-                pre {{ background-color: #eee; padding: 10px; border-radius: 5px; overflow-x: auto; white-space: pre-wrap; word-break: break-all; }}
-                table {{ width: 100%; border-collapse: collapse; margin-top: 10px; }}
-                th, td {{ border: 1px solid #ddd; padding: 8px; text-align: left; }}
-                th {{ background-color: #f2f2f2; }}
-            </style>
-        </head>
-        <body>
-            <h1>{self.tr("Infoscava Analysis Report")}</h1>
-            <div class="section">
-                <h2>{self.tr("File Metadata")}</h2>
-                <table>
-                    <tbody>
+        kind = os.path.splitext(filename)[1].lower().lstrip('.')
+        if kind not in ('json', 'txt', 'html'):
+            QMessageBox.warning(self, self.tr("Export Error"), self.tr("Unsupported export format. Please use a .json, .txt or .html file name."))
+            return
+
+        if self._rendered_metadata_cache is None:
+            self._build_rendered_metadata_cache()
+
+        self._flush_dirty_tabs()
+        # Snapshot everything the report needs into plain Python values so the worker never touches Qt widgets
+        previews = {
+            'rendered_metadata': list(self._rendered_metadata_cache),
+            'text': _head_text(self.text_tab.text_editor, self.app_settings['MAX_TEXT_PREVIEW_LINES'] * 2),
+        }
+        if kind == 'html':
+            previews['hex'] = self.hex_tab.hex_text(self.app_settings['MAX_HEX_PREVIEW_BYTES'] * 4)
+            previews['structured'] = self._structured_preview_text(self.app_settings['MAX_STRUCTURED_PREVIEW_LINES'] * 2)
+            previews['base64'] = self.base64_tab.preview_text(1000)
+
+        self._export_worker = ExportWorker(filename, kind, dict(self.file_metadata), previews)
+        self._export_worker.signals.finished.connect(self._on_export_finished)
+        self._export_worker.signals.error.connect(self._on_export_error)
+        self.status_bar.showMessage(self.tr("Exporting analysis to {0}...").format(filename))
+        self.progress_bar.setRange(0, 0) # Indeterminate while the report is written
+        self.progress_bar.show()
+        self.thread_pool.start(self._export_worker)
+
+    @Slot(str)
+    def _on_export_finished(self, filename):
+        self._export_worker = None
+        self.progress_bar.setRange(0, 100)
+        self.progress_bar.hide()
+        self.status_bar.showMessage(self.tr("Analysis exported to {0}").format(filename), 5000)
+
+    @Slot(str)
+    def _on_export_error(self, message):
+        self._export_worker = None
+        self.progress_bar.setRange(0, 100)
+        self.progress_bar.hide()
+        QMessageBox.critical(self, self.tr("Export Error"), self.tr("Failed to export analysis: {0}").format(message))
+
+    def _build_rendered_metadata_cache(self):
+        """
+        Formats the file metadata once so the TXT and HTML exporters can share the result.
+        Built lazily on the first export after an analysis, so files that are never exported don't pay for it.
         """
+        rows = []
         for key, value in self.file_metadata.items():
-            # Skip plugin_analysis_results for top-level display, handle separately
+            # Skip plugin_analysis_results for top-level display, exporters handle it separately
             if key == 'plugin_analysis_results':
                 continue
 
-            display_value = value
             if isinstance(value, dict):
-                display_value = "<pre>" + json.dumps(value, indent=2, ensure_ascii=False) + "</pre>"
-            elif isinstance(value, float):
-                if key == 'encoding_confidence':
-                    display_value = f"{value:.2f}%"
-                else:
-                    display_value = f"{value:.4f}"
-            elif key == 'size':
-                display_value = human_readable_size(value)
-
-            report_html += f"""
-                        <tr>
-                            <td class="label">{key.replace('_', ' ').title()}:</td>
-                            <td>{display_value}</td>
-                        </tr>
-            """
-        report_html += """
-                    </tbody>
-                </table>
-            </div>
-        """
-
-        # Add Plugin Analysis Results
-        if 'plugin_analysis_results' in self.file_metadata and self.file_metadata['plugin_analysis_results']:
-            report_html += f"""
-            <div class="section">
-                <h2>{self.tr("Plugin Analysis Results")}</h2>
-            """
-            for plugin_name, plugin_output in self.file_metadata['plugin_analysis_results'].items():
-                report_html += f"<h3>{self.tr('Plugin')}: {plugin_name}</h3>"
-                if isinstance(plugin_output, dict) and plugin_output.get("infoscava_output_type") == "html":
-                    report_html += plugin_output.get("content", "<p>No HTML content provided.</p>")
-                elif isinstance(plugin_output, dict):
-                    report_html += f"<pre>{json.dumps(plugin_output, indent=2, ensure_ascii=False)}</pre>"
+                # Pretty-printing is deferred to the exporters, which stream it into the output file
+                text_value = value
+                html_value = None
+            else:
+                if isinstance(value, float):
+                    if key == 'encoding_confidence':
+                        text_value = f"{value:.2f}%"
+                    else:
+                        text_value = f"{value:.4f}"
+                elif key == 'size':
+                    text_value = human_readable_size(value)
                 else:
-                    report_html += f"<pre>{str(plugin_output)}</pre>"
-            report_html += "</div>"
-
-
-        if self.text_tab.text_editor.toPlainText():
-            report_html += f"""
-            <div class="section">
-                <h2>{self.tr("Text Content (Preview)")}</h2>
-                <pre>{self.text_tab.text_editor.toPlainText()[:self.app_settings['MAX_TEXT_PREVIEW_LINES'] * 2]}</pre>
-            </div>
-            """
-
-        if self.hex_tab.hex_editor.toPlainText():
-            report_html += f"""
-            <div class="section">
-                <h2>{self.tr("Hexadecimal View (Preview)")}</h2>
-                <pre>{self.hex_tab.hex_editor.toPlainText()[:self.app_settings['MAX_HEX_PREVIEW_BYTES'] * 4]}</pre>
-            </div>
-            """
-
-        if self.structured_tab.text_editor.toPlainText() or self.structured_tab.table_widget.rowCount() > 0:
-            # Check which widget is currently active in structured tab
-            current_structured_content = ""
-            if self.structured_tab.stacked_widget.currentIndex() == 0: # Text editor is active
-                current_structured_content = self.structured_tab.text_editor.toPlainText()
-            else: # Table widget is active (CSV)
-                # Reconstruct CSV from table for HTML export
-                csv_rows = []
-                # Add headers
-                headers = []
-                for col in range(self.structured_tab.table_widget.columnCount()):
-                    header_item = self.structured_tab.table_widget.horizontalHeaderItem(col)
-                    headers.append(header_item.text() if header_item else "")
-                if headers:
-                    # Fix: Use string concatenation instead of f-string for the problematic part
-                    csv_rows.append(",".join('"' + h.replace('"', '""') + '"' for h in headers)) # Basic CSV quoting
-
-                # Add data rows
-                for row_idx in range(self.structured_tab.table_widget.rowCount()):
-                    row_data = []
-                    for col_idx in range(self.structured_tab.table_widget.columnCount()):
-                        item = self.structured_tab.table_widget.item(row_idx, col_idx)
-                        cell_value = item.text() if item else ""
-                        # Fix: Use string concatenation instead of f-string for the problematic part
-                        row_data.append('"' + cell_value.replace('"', '""') + '"')
-                    csv_rows.append(",".join(row_data))
-                current_structured_content = "\n".join(csv_rows)
-
-            if current_structured_content:
-                report_html += f"""
-                <div class="section">
-                    <h2>{self.tr("Structured View (Preview)")}</h2>
-                    <pre>{current_structured_content[:self.app_settings['MAX_STRUCTURED_PREVIEW_LINES'] * 2]}</pre>
-                </div>
-                """
-
-        if self.base64_tab.base64_text_edit.toPlainText():
-            report_html += f"""
-            <div class="section">
-                <h2>{self.tr("Base64 Encoded Content")}</h2>
-                <pre>{self.base64_tab.base64_text_edit.toPlainText()[:1000]}</pre>
-            </div>
-            """
-
-        report_html += """
-        </body>
-        </html>
-        """
-        return report_html
+                    text_value = str(value)
+                html_value = html.escape(text_value, quote=True) # Filenames and EXIF strings may contain markup
+            rows.append((key.replace('_', ' ').title(), text_value, html_value))
+        self._rendered_metadata_cache = rows
+
+    def _structured_preview_text(self, max_chars):
+        """Returns the first max_chars characters shown in the Structured View as text (CSV for the table view)."""
+        if self.structured_tab.stacked_widget.currentIndex() == 0: # Text editor is active
+            return _head_text(self.structured_tab.text_editor, max_chars)
+
+        table = self.structured_tab.table_widget
+        if table.rowCount() == 0:
+            return ""
+        # Reconstruct CSV from table for HTML export
+        csv_rows = []
+        # Add headers
+        headers = []
+        for col in range(table.columnCount()):
+            header_item = table.horizontalHeaderItem(col)
+            headers.append(header_item.text() if header_item else "")
+        if headers:
+            csv_rows.append(",".join('"' + h.replace('"', '""') + '"' for h in headers)) # Basic CSV quoting
+
+        # Add data rows, stopping once the preview is full
+        length = sum(len(row) + 1 for row in csv_rows)
+        for row_idx in range(table.rowCount()):
+            if length >= max_chars:
+                break
+            row_data = []
+            for col_idx in range(table.columnCount()):
+                item = table.item(row_idx, col_idx)
+                cell_value = item.text() if item else ""
+                row_data.append('"' + cell_value.replace('"', '""') + '"')
+            csv_rows.append(",".join(row_data))
+            length += len(csv_rows[-1]) + 1
+        return "\n".join(csv_rows)[:max_chars]
 
     def _show_about_dialog(self):
-        QMessageBox.about(self, self.tr("About Infoscava"),
-                          self.tr("<h3>Infoscava</h3>"
-                                  "<p>Universal File Analyzer</p>"
-                                  "<p>Version: 2.1.9</p>"
-                                  "<p>Developer: Muhammed Shafin P (GitHub: <a href='https://github.com/hejhdiss'>hejhdiss</a>)</p>"
-                                  "<p>Infoscava (Info + Scava, Latin for 'dig') is designed to excavate information from any file type.</p>"))
+        if self._about_html is None:
+            self._about_html = self.tr("<h3>Infoscava</h3>"
+                                       "<p>Universal File Analyzer</p>"
+                                       "<p>Version: 2.1.9</p>"
+                                       "<p>Developer: Muhammed Shafin P (GitHub: <a href='https://github.com/hejhdiss'>hejhdiss</a>)</p>"
+                                       "<p>Infoscava (Info + Scava, Latin for 'dig') is designed to excavate information from any file type.</p>")
+        QMessageBox.about(self, self.tr("About Infoscava"), self._about_html)
+
+    def changeEvent(self, event):
+        """Drops cached translated text when the application language changes."""
+        if event.type() == QEvent.LanguageChange:
+            self._about_html = None
+        super().changeEvent(event)
 
     def _show_help_dialog(self):
         help_dialog = HelpDialog(self)
         help_dialog.exec()
 
-    def _save_theme_preference(self, theme_name):
-        """Saves the current theme preference to a file."""
+    def _save_theme_preference(self):
+        """Schedules the current theme to be saved as the preference; rapid toggles are coalesced into a single write."""
+        if self._current_theme == self._saved_theme:
+            # Already on disk (e.g. the theme applied at startup, or toggled back): drop any pending write
+            self._theme_save_timer.stop()
+            self._pending_theme = None
+            return
+        self._pending_theme = self._current_theme
+        self._theme_save_timer.start()
+
+    def _flush_theme_preference(self):
+        """Writes a pending theme preference to disk, if any."""
+        if self._pending_theme is None:
+            return
         try:
-            with open(THEME_SETTINGS_FILE, 'w') as f:
-                json.dump({'theme': theme_name}, f)
+            _atomic_write_json(THEME_SETTINGS_FILE, {'theme': self._pending_theme})
+            self._saved_theme = self._pending_theme
         except Exception as e:
             pass # Removed logging
+        self._pending_theme = None
 
     def _load_theme_preference(self):
         """Loads the last saved theme preference from a file."""
+        if self._pending_theme is not None: # Not flushed to disk yet
+            return self._pending_theme
         try:
-            if os.path.exists(THEME_SETTINGS_FILE):
-                with open(THEME_SETTINGS_FILE, 'r') as f:
-                    settings = json.load(f)
-                    return settings.get('theme', 'dark') # Default to 'dark' if not found
-        except Exception as e:
-            pass # Removed logging
-        return 'dark' # Default to dark theme if file doesn't exist or error occurs
+            # One read of the raw bytes; a missing file simply raises instead of costing an extra stat
+            with open(THEME_SETTINGS_FILE, 'rb') as f:
+                data = f.read()
+            return (orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)).get('theme', 'dark')
+        except (OSError, ValueError, AttributeError): # Missing, unreadable, malformed or not a JSON object
+            return 'dark'
 
     def _toggle_theme(self):
         """Toggles between dark and light themes."""
-        current_theme = self._load_theme_preference()
-        if current_theme == 'dark':
+        if self._current_theme == 'dark':
             self._set_light_theme()
         else:
             self._set_dark_theme()
-    def _set_dark_theme(self):
+    def _set_dark_theme(self, persist=True):
+        """Applies the dark theme; persist=False skips the status message and saving it as the preference."""
+        if self._current_theme == 'dark':
+            return # Already applied; re-setting the palette and stylesheet would restyle every widget for nothing
         app = QApplication.instance()
-        palette = app.palette()
-        palette.setColor(QPalette.Window, QColor("#1e1e1e"))
-        palette.setColor(QPalette.WindowText, QColor("#ffffff"))
-        palette.setColor(QPalette.Base, QColor("#2d2d30"))
-        palette.setColor(QPalette.AlternateBase, QColor("#3c3c3c"))
-        palette.setColor(QPalette.ToolTipBase, QColor("#2d2d30"))
-        palette.setColor(QPalette.ToolTipText, QColor("#ffffff"))
-        palette.setColor(QPalette.Text, QColor("#ffffff"))
-        palette.setColor(QPalette.Button, QColor("#333333"))
-        palette.setColor(QPalette.ButtonText, QColor("#ffffff"))
-        palette.setColor(QPalette.BrightText, QColor("red"))
-        palette.setColor(QPalette.Link, QColor("#61afef"))
-        palette.setColor(QPalette.Highlight, QColor("#007acc"))
-        palette.setColor(QPalette.HighlightedText, QColor("#ffffff"))
-        app.setPalette(palette)
-
-        QApplication.instance().setStyleSheet("""
-            /* Reset QTreeView::branch styling to allow native indicators */
-            QTreeView::branch {{
-                border: none;
-                background: transparent;
-                padding: 0;
-                margin: 0;
-                width: 16px; /* Explicit width to ensure space for indicator */
-                height: 16px; /* Explicit height to ensure space for indicator */
-            }}
-            /* General QTreeView styling for visibility */
-            QTreeView {{
-                background-color: #2d2d30; /* Dark background */
-                color: #ffffff; /* White text */
-                alternate-background-color: #3c3c3c;
-                border: 1px solid #555555;
-            }}
-            QTreeView::item {{
-                color: #ffffff;
-            }}
-            QTreeView::item:selected {{
-                background-color: #007acc;
-                color: #ffffff;
-            }}
-        """)
-        self.status_bar.showMessage(self.tr("Switched to Dark Theme"), 3000)
-        self._save_theme_preference('dark')
+        if InfoscavaMainWindow._dark_palette is not None:
+            app.setPalette(InfoscavaMainWindow._dark_palette)
+        else:
+            palette = app.palette()
+            for role, color in _DARK_PALETTE_ROLES:
+                palette.setColor(role, color)
+            app.setPalette(palette)
+            InfoscavaMainWindow._dark_palette = palette # Reused by every later switch
+
+        app.setStyleSheet(_DARK_QSS)
+        self._current_theme = 'dark'
+        if persist:
+            self.status_bar.showMessage(self.tr("Switched to Dark Theme"), 3000)
+            self._save_theme_preference()
     
 
-    def _set_light_theme(self):
+    def _set_light_theme(self, persist=True):
+        """Applies the light theme; persist=False skips the status message and saving it as the preference."""
+        if self._current_theme == 'light':
+            return # Already applied
         app = QApplication.instance()
-        palette = app.palette()
-        # Refined light theme colors for a production-level look
-        palette.setColor(QPalette.Window, QColor("#f8f8f8")) # Main window background - soft white
-        palette.setColor(QPalette.WindowText, QColor("#1e1e1e")) # Dark text for readability
-        palette.setColor(QPalette.Base, QColor("#ffffff")) # Base for input fields, text areas - pure white for content
-        palette.setColor(QPalette.AlternateBase, QColor("#f0f0f0")) # Alternate row colors in lists/tables
-        palette.setColor(QPalette.ToolTipBase, QColor("#ffffff"))
-        palette.setColor(QPalette.ToolTipText, QColor("#1e1e1e"))
-        palette.setColor(QPalette.Text, QColor("#1e1e1e"))
-        palette.setColor(QPalette.Button, QColor("#e8e8e8")) # Light gray button background
-        palette.setColor(QPalette.ButtonText, QColor("#1e1e1e"))
-        palette.setColor(QPalette.BrightText, QColor("red")) # Standard bright text color
-        palette.setColor(QPalette.Link, QColor("#007bff")) # Standard blue for links
-        palette.setColor(QPalette.Highlight, QColor("#aaddff")) # Light blue for selection highlight
-        palette.setColor(QPalette.HighlightedText, QColor("#1e1e1e")) # Dark text on highlight
-        app.setPalette(palette)
+        if InfoscavaMainWindow._light_palette is not None:
+            app.setPalette(InfoscavaMainWindow._light_palette)
+        else:
+            palette = app.palette()
+            for role, color in _LIGHT_PALETTE_ROLES:
+                palette.setColor(role, color)
+            app.setPalette(palette)
+            InfoscavaMainWindow._light_palette = palette # Reused by every later switch
 
         # Apply comprehensive stylesheet overrides for light theme to ensure readability and consistent look
-        QApplication.instance().setStyleSheet(f"""
-            QMainWindow, QWidget, QSplitter {{
-                background-color: #f8f8f8; /* Soft white for main window background */
-                color: #1e1e1e; /* Dark text */
-            }}
-            QMenuBar {{
-                background-color: #e8e8e8; /* Slightly darker than main window for distinction */
-                color: #1e1e1e;
-                border-bottom: 1px solid #d8d8d8; /* Subtle border */
-            }}
-            QMenuBar::item {{
-                background-color: transparent;
-                color: #1e1e1e;
-                padding: 5px 10px;
-            }}
-            QMenuBar::item:selected {{
-                background-color: #d0d0d0; /* Highlight on hover */
-            }}
-            QMenu {{
-                background-color: #ffffff; /* Pure white for dropdown menus */
-                color: #1e1e1e;
-                border: 1px solid #d8d8d8;
-                border-radius: 4px;
-            }}
-            QMenu::item {{
-                padding: 6px 20px 6px 10px; /* Padding for menu items */
-            }}
-            QMenu::item:selected {{
-                background-color: #aaddff;
-                color: #1e1e1e;
-            }}
-            QTextEdit, QTextBrowser {{
-                background-color: #ffffff; /* Pure white for text content areas */
-                color: #1e1e1e;
-                border: 1px solid #d8d8d8;
-                border-radius: 4px;
-                padding: 5px;
-            }}
-            QComboBox {{
-                background-color: #ffffff;
-                color: #1e1e1e;
-                border: 1px solid #d8d8d8;
-                border-radius: 4px;
-                padding: 2px 5px;
-                selection-background-color: #aaddff;
-                selection-color: #1e1e1e;
-            }}
-            QLineEdit {{
-                background-color: #ffffff;
-                color: #1e1e1e;
-                border: 1px solid #d8d8d8;
-                border-radius: 4px;
-                padding: 2px 5px;
-            }}
-            QLabel {{
-                color: #1e1e1e;
-            }}
-            QPushButton {{
-                background-color: #e8e8e8;
-                color: #1e1e1e;
-                border: 1px solid #c8c8c8; /* Slightly darker border for buttons */
-                border-radius: 4px;
-                padding: 6px 12px;
-                font-weight: 500;
-            }}
-            QPushButton:hover {{
-                background-color: #d8d8d8;
-                border-color: #b8b8b8;
-            }}
-            QPushButton:pressed {{
-                background-color: #c8c8c8;
-                border-color: #a8a8a8;
-            }}
-            QTreeView {{
-                background-color: #f5f5f5; /* Very subtle darker white for QTreeView background */
-                color: #1e1e1e;
-                alternate-background-color: #f0f0f0; /* Clearer alternate row color */
-                border: 1px solid #d8d8d8;
-                border-radius: 4px;
-            }}
-            QTreeView::item {{
-                color: #1e1e1e;
-                padding: 3px 0; /* Add some vertical padding to items */
-            }}
-            QTreeView::item:selected {{
-                background-color: #aaddff;
-                color: #1e1e1e;
-            }}
-            QTreeView::branch:selected {{
-                background-color: #aaddff; /* Ensure branches also highlight correctly */
-            }}
-            /* Removed specific QTreeView::branch styling to allow native indicators */
-            QStatusBar {{
-                background-color: #e8e8e8;
-                color: #1e1e1e;
-                border-top: 1px solid #d8d8d8;
-            }}
-            QProgressBar {{
-                background-color: #e0e0e0;
-                color: #1e1e1e;
-                border: 1px solid #c0c0c0;
-                border-radius: 5px;
-                text-align: center;
-            }}
-            QProgressBar::chunk {{
-                background-color: #007bff;
-                border-radius: 5px;
-            }}
-            QTabWidget::pane {{ /* The content area below the tabs */
-                border: 1px solid #d8d8d8;
-                background-color: #f8f8f8; /* Matches main window background */
-                border-radius: 4px;
-                margin-top: -1px; /* Overlap with tab bar border */
-            }}
-            QTabBar::tab {{
-                background: #e5e5e5; /* Light grey for inactive tabs */
-                border: 1px solid #d8d8d8;
-                border-bottom-color: #d8d8d8; /* Same as pane border */
-                border-top-left-radius: 4px;
-                border-top-right-radius: 4px;
-                padding: 8px 15px;
-                margin-right: 2px;
-                color: #1e1e1e;
-            }}
-            QTabBar::tab:selected {{
-                background: #f8f8f8; /* Matches main window background */
-                border-bottom-color: #f8f8f8; /* Make selected tab's bottom border blend with pane */
-                font-weight: bold;
-            }}
-            QTabBar::tab:hover:!selected {{
-                background: #d8d8d8; /* Slightly darker grey on hover for inactive tabs */
-            }}
-        """)
-        self.status_bar.showMessage(self.tr("Switched to Light Theme"), 3000)
-        self._save_theme_preference('light')
+        app.setStyleSheet(_LIGHT_QSS)
+        self._current_theme = 'light'
+        if persist:
+            self.status_bar.showMessage(self.tr("Switched to Light Theme"), 3000)
+            self._save_theme_preference()
 
 
 
 
 
     def closeEvent(self, event):
-        """Ensures plugin history is saved on application close."""
+        """Ensures plugin history and a pending theme preference are saved on application close."""
+        self._theme_save_timer.stop()
+        self._file_change_timer.stop()
+        self._flush_theme_preference()
         self.plugin_manager._save_history()
         super().closeEvent(event)
 
@@ -3047,65 +3920,183 @@ class InfoscavaMainWindow(QMainWindow):
         """Applies new settings to the application and saves them."""
         self.app_settings = new_settings
         self.settings_manager.save_settings(self.app_settings)
+        # Only the previews depend on these settings right away (MD5 settings apply from the next analysis),
+        # so re-rendering the previews is enough; this also clears the previews when no file is loaded
         self._update_ui_with_settings()
-        # If file size limits changed, re-analyze the current file to apply new limits
-        if self.current_filepath and os.path.exists(self.current_filepath):
-            self._load_file(self.current_filepath)
-        else:
-            # If no file is loaded, clear existing content previews to reflect new limits
-            self._clear_all_tabs_content()
         QMessageBox.information(self, self.tr("Settings Saved"), self.tr("Application settings updated successfully."))
 
     def _update_ui_with_settings(self):
         """Propagates current settings to relevant UI components."""
-        self.text_tab.max_text_preview_lines = self.app_settings['MAX_TEXT_PREVIEW_LINES']
-        self.hex_tab.max_hex_preview_bytes = self.app_settings['MAX_HEX_PREVIEW_BYTES']
-        self.structured_tab.max_structured_preview_lines = self.app_settings['MAX_STRUCTURED_PREVIEW_LINES']
-        self.plugin_manager.update_settings(self.app_settings['MAX_PLUGIN_HISTORY_ENTRIES'])
+        s = self.app_settings
+        max_text = s['MAX_TEXT_PREVIEW_LINES']
+        max_hex = s['MAX_HEX_PREVIEW_BYTES']
+        max_struct = s['MAX_STRUCTURED_PREVIEW_LINES']
+        max_full = s['MAX_FILE_SIZE_FOR_FULL_READ']
+        max_hist = s['MAX_PLUGIN_HISTORY_ENTRIES']
+
+        if max_hist != self._last_plugin_history_limit: # Trimming walks the whole history
+            self.plugin_manager.update_settings(max_hist)
+            self._last_plugin_history_limit = max_hist
+
+        preview_settings = (max_text, max_hex, max_struct, max_full)
+        if preview_settings == self._last_preview_settings and (not self.current_filepath or self._content_is_watched_and_fresh()):
+            return # Nothing the previews depend on has changed
+        self._last_preview_settings = preview_settings
+        self.text_tab.max_text_preview_lines = max_text
+        self.hex_tab.max_hex_preview_bytes = max_hex
+        self.structured_tab.max_structured_preview_lines = max_struct
 
         # Re-render current content with new preview limits if a file is loaded
-        if self.current_filepath and os.path.exists(self.current_filepath):
+        if self.current_filepath:
             # Re-read file content to ensure it's fresh if needed, then update tabs
             try:
-                with open(self.current_filepath, 'rb') as f:
-                    self.file_content_bytes = f.read()
+                if self._content_is_watched_and_fresh():
+                    # The watcher would have flagged any change, so the cached bytes are current without touching the disk
+                    cache_key = self._content_cache_key
+                else:
+                    st = os.stat(self.current_filepath) # Single stat: existence, size and mtime in one syscall
+                    cache_key = (self.current_filepath, st.st_mtime_ns, st.st_size)
                 # Pass is_large_file based on new setting
-                is_large_file = os.path.getsize(self.current_filepath) > self.app_settings['MAX_FILE_SIZE_FOR_FULL_READ']
-                
-                # Update content in tabs with new limits
-                self.text_tab.set_file_content(self.file_content_bytes, self.file_metadata.get('encoding'), is_large_file, self.app_settings['MAX_TEXT_PREVIEW_LINES'])
-                self.hex_tab.set_file_content(self.file_content_bytes, is_large_file, self.app_settings['MAX_HEX_PREVIEW_BYTES'])
-                self.structured_tab.set_file_content(self.file_content_bytes, self.file_metadata.get('mime_type'), self.file_metadata.get('encoding'), is_large_file, self.app_settings['MAX_STRUCTURED_PREVIEW_LINES'])
+                is_large_file = cache_key[2] > max_full
+                # Large files are only shown in preview mode, so read just enough bytes to fill the previews
+                preview_cap = None
+                if is_large_file:
+                    preview_cap = max(max_text * ESTIMATED_BYTES_PER_LINE, max_hex, max_struct * ESTIMATED_BYTES_PER_LINE)
+                self._file_read_generation += 1 # Supersedes any re-read still in flight
+                if cache_key == self._content_cache_key:
+                    # Only preview limits changed; the bytes already in memory are still what's on disk
+                    preview_bytes = self.file_content_bytes if preview_cap is None else self.file_content_bytes[:preview_cap]
+                    self._show_preview(preview_bytes, is_large_file, cache_key)
+                else:
+                    # Read in the background so a big file doesn't freeze the window
+                    worker = FileReadWorker(self._file_read_generation, self.current_filepath, preview_cap, is_large_file, cache_key)
+                    worker.signals.finished.connect(self._on_file_reread)
+                    worker.signals.error.connect(self._on_file_reread_error)
+                    self.thread_pool.start(worker)
             except Exception as e:
                 # Handle potential errors during re-reading file
-                self.status_bar.showMessage(self.tr(f"Error re-applying settings to current file: {e}"), 5000)
-        else:
+                self.status_bar.showMessage(self.tr("Error re-applying settings to current file: {0}").format(e), 5000)
+        elif self._has_content:
             # If no file is loaded, just clear the previews to reflect the new limits
             self._clear_all_tabs_content()
 
 
+    def _content_is_watched_and_fresh(self):
+        """True if file_content_bytes holds the current file and the watcher has reported no change since it was read."""
+        return (not self._content_stale
+                and self._content_cache_key is not None
+                and self._content_cache_key[0] == self.current_filepath
+                and self._watched_path == self.current_filepath
+                and self._watched_path in self.file_watcher.files())
+
+    @Slot(int, object, bool, object)
+    def _on_file_reread(self, generation, data, is_large_file, cache_key):
+        """Shows the bytes re-read by a FileReadWorker, unless a newer load or re-read superseded it."""
+        if generation != self._file_read_generation:
+            return
+        if not is_large_file:
+            self.file_content_bytes = data
+            self._content_cache_key = cache_key
+            self._content_stale = False
+        # else: keep the full content loaded by the analysis for base64, histogram and plugins
+        self._show_preview(data, is_large_file, cache_key)
+
+    @Slot(int, str)
+    def _on_file_reread_error(self, generation, message):
+        if generation != self._file_read_generation:
+            return
+        self.status_bar.showMessage(self.tr("Error re-applying settings to current file: {0}").format(message), 5000)
+
+    def _show_preview(self, preview_bytes, is_large_file, cache_key):
+        """
+        Updates the preview tabs with new content; is_large_file makes each tab show its preview notice.
+        Only the visible tab is rendered now, the others when the user switches to them.
+        """
+        self._pending_preview = (preview_bytes, is_large_file, cache_key)
+        self._has_content = True
+        self._dirty_tabs = {self.text_tab, self.hex_tab, self.structured_tab}
+        self._on_current_tab_changed(self.tab_widget.currentIndex())
+
+    def _render_preview_tab(self, tab):
+        """Renders one of the preview tabs from the pending preview bytes with the current limits."""
+        preview_bytes, is_large_file, cache_key = self._pending_preview
+        encoding = self.file_metadata.get('encoding')
+        if tab is self.text_tab:
+            decoded = self._decoded_preview_text(preview_bytes, encoding, cache_key) if is_large_file else None
+            self.text_tab.set_file_content(preview_bytes, encoding, is_large_file, self.app_settings['MAX_TEXT_PREVIEW_LINES'], decoded_text=decoded)
+        elif tab is self.hex_tab:
+            max_hex = self.app_settings['MAX_HEX_PREVIEW_BYTES']
+            self.hex_tab.set_file_content(preview_bytes[:max_hex] if is_large_file else preview_bytes, is_large_file, max_hex)
+        elif tab is self.structured_tab:
+            mime_type = self.file_metadata.get('mime_type') or ''
+            if is_large_file and 'json' in mime_type:
+                # JSON can only be parsed as a whole document, so the byte window of the other previews doesn't apply;
+                # file_content_bytes holds the whole file
+                self.structured_tab.set_file_content(self.file_content_bytes, mime_type, encoding, True, self.app_settings['MAX_STRUCTURED_PREVIEW_LINES'])
+            else:
+                decoded = self._decoded_preview_text(preview_bytes, encoding, cache_key) if is_large_file else None
+                self.structured_tab.set_file_content(preview_bytes, mime_type, encoding, is_large_file, self.app_settings['MAX_STRUCTURED_PREVIEW_LINES'], decoded_text=decoded)
+
+    def _decoded_preview_text(self, preview_bytes, encoding, cache_key):
+        """
+        Decodes a large-file preview once for both the text and structured tabs.
+        The result is memoized by (content key, encoding, preview length) for later settings applies.
+        """
+        key = (cache_key, encoding, len(preview_bytes))
+        if self._decoded_preview is None or self._decoded_preview[0] != key:
+            try:
+                decoded = preview_bytes.decode(encoding or "utf-8", errors='replace')
+            except Exception: # Unknown encoding name
+                decoded = preview_bytes.decode("utf-8", errors='replace')
+            self._decoded_preview = (key, decoded)
+        return self._decoded_preview[1]
+
+    @Slot(int)
+    def _on_current_tab_changed(self, index):
+        """Renders a preview tab that went stale while it was hidden."""
+        tab = self.tab_widget.widget(index)
+        if tab is self.search_tab: # The search tab searches the text tab's decoded content
+            tab = self.text_tab
+        if tab in self._dirty_tabs:
+            self._dirty_tabs.discard(tab)
+            self._render_preview_tab(tab)
+
+    def _flush_dirty_tabs(self):
+        """Renders all stale preview tabs, e.g. before their contents are exported."""
+        while self._dirty_tabs:
+            self._render_preview_tab(self._dirty_tabs.pop())
+
     def _load_theme_settings(self):
         """Loads the saved theme preference and applies it at startup."""
         theme_name = self._load_theme_preference()
+        self._saved_theme = theme_name # Toggling back to it later must not write the same value again
         if theme_name == 'dark':
-            self._set_dark_theme()
+            self._set_dark_theme(persist=False) # Already the saved preference
         else:
-            self._set_light_theme()
+            self._set_light_theme(persist=False)
 # Assuming these Base64 strings are defined elsewhere, e.g., in your main app
 
+def _existing_file(path):
+    """argparse type for --file: rejects a path that is not a file before Qt is started."""
+    if not os.path.isfile(path):
+        raise argparse.ArgumentTypeError(f"'{path}' is not an existing file")
+    return path
+
 def main():
     parser = argparse.ArgumentParser(description="Infoscava - Universal File Analyzer")
-    parser.add_argument("--file", help="Path to the file to analyze on startup.")
+    parser.add_argument("--file", type=_existing_file, help="Path to the file to analyze on startup.")
     parser.add_argument("--lang", help="Set application language (e.g., 'en', 'fr').")
     args = parser.parse_args()
 
     app = QApplication(sys.argv)
 
-    translator = QTranslator()
-    if args.lang:
+    if args.lang: # Only pay for a translator when a language was requested
+        translator = QTranslator()
         locale = QLocale(args.lang)
-        if translator.load(locale, "infoscava", "_", ":/translations"):
+        # Try the catalog named after --lang directly before letting Qt search the locale's fallbacks
+        if translator.load(_QM_PATH_TMPL.format(args.lang)) or translator.load(locale, "infoscava", "_", _QM_DIR):
             app.installTranslator(translator)
+            app._translator = translator # Keep a reference so it isn't garbage collected
         else:
             pass # Removed logging
 